@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Import-time budget check for the offline tools
+
+Starts fresh interpreters that import offline.py and scraper.py, reports the
+median wall time, and fails if either goes over budget or pulls in a
+scraping dependency at import time.
+
+    python benchmarks/import_time.py [--budget-ms 150] [--runs 9]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that must not be loaded just by importing an entry point
+HEAVY_MODULES = ("playwright", "aiohttp", "aiofiles", "dotenv", "pyarrow")
+
+PROBE = (
+    "import sys, {module}; "
+    "heavy = [m for m in {heavy!r} if m in sys.modules]; "
+    "print(','.join(heavy))"
+)
+
+
+def measure(module, runs):
+    """Return (median seconds, heavy modules loaded) for importing `module`."""
+    timings = []
+    heavy = ""
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-c", PROBE.format(module=module, heavy=HEAVY_MODULES)],
+            cwd=ROOT, capture_output=True, text=True, check=True
+        )
+        timings.append(time.perf_counter() - start)
+        heavy = result.stdout.strip()
+    return statistics.median(timings), heavy
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--budget-ms", type=float, default=150,
+                        help="Maximum median interpreter start + import time (default: 150)")
+    parser.add_argument("--runs", type=int, default=9)
+    args = parser.parse_args()
+
+    baseline, _ = measure("sys", args.runs)
+    print(f"{'interpreter':<12} {baseline * 1000:7.1f} ms")
+
+    failed = False
+    for module in ("offline", "scraper"):
+        elapsed, heavy = measure(module, args.runs)
+        status = "ok"
+        if heavy:
+            status = f"FAIL: imported {heavy}"
+            failed = True
+        elif elapsed * 1000 > args.budget_ms:
+            status = f"FAIL: over {args.budget_ms:.0f} ms budget"
+            failed = True
+        print(f"{module:<12} {elapsed * 1000:7.1f} ms  {status}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Peak memory of slotted records vs. plain dicts
+
+Builds a synthetic directory (families with members, staff, groups and
+events) once as the dicts the scrapers used to return and once as
+src.models records, each in a fresh interpreter, and reports peak RSS and
+the time to serialize the result with json.dump and with the exporter's
+export_json_chunks().
+
+    python benchmarks/memory_records.py [--families 50000]
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+WORKER = r'''
+import io, json, resource, sys, time
+sys.path.insert(0, {root!r})
+from src.exporter import export_json_chunks
+from src.models import Event, Family, Group, Member, Staff, to_json_value
+
+variant, families = sys.argv[1], int(sys.argv[2])
+before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+def text(prefix, i):
+    # Distinct strings per record, like real scraped text
+    return f"{{prefix}} {{i}}"
+
+if variant == "dict":
+    data = [
+        {{"id": f"family_{{i:06d}}", "name": text("Family", i), "members_text": text("A, B & C", i),
+          "members": [{{"name": text("Member", i * 3 + m), "email": "", "phone": ""}} for m in range(3)],
+          "photo": text("https://example.org/photo", i), "detail_url": text("https://example.org/f", i),
+          "contact": {{}}}}
+        for i in range(families)
+    ]
+    data += [{{"id": f"staff_{{i:06d}}", "name": text("Staff", i), "title": text("Title", i),
+               "email": "", "phone": "", "photo": ""}} for i in range(families // 10)]
+    data += [{{"id": f"group_{{i:06d}}", "name": text("Group", i), "description": text("About", i),
+               "leaders": [], "photo": ""}} for i in range(families // 20)]
+    data += [{{"name": text("Person", i), "date": text("January", i % 28), "month_day": "01-01"}}
+             for i in range(families)]
+else:
+    data = [
+        Family(id=f"family_{{i:06d}}", name=text("Family", i), members_text=text("A, B & C", i),
+               members=[Member(name=text("Member", i * 3 + m)) for m in range(3)],
+               photo=text("https://example.org/photo", i), detail_url=text("https://example.org/f", i))
+        for i in range(families)
+    ]
+    data += [Staff(id=f"staff_{{i:06d}}", name=text("Staff", i), title=text("Title", i))
+             for i in range(families // 10)]
+    data += [Group(id=f"group_{{i:06d}}", name=text("Group", i), description=text("About", i))
+             for i in range(families // 20)]
+    data += [Event(kind="birthday", name=text("Person", i), date=text("January", i % 28), month_day="01-01")
+             for i in range(families)]
+
+peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+json.dump(data, io.StringIO(), default=to_json_value)
+elapsed = time.perf_counter() - start
+start = time.perf_counter()
+"".join(export_json_chunks({{"records": data}}))
+exported = time.perf_counter() - start
+print(len(data), before, peak, elapsed, exported)
+'''
+
+
+def run(variant, families):
+    result = subprocess.run(
+        [sys.executable, "-c", WORKER.format(root=ROOT), variant, str(families)],
+        capture_output=True, text=True, check=True
+    )
+    records, before, peak, elapsed, exported = result.stdout.split()
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return int(records), int(before) / scale, int(peak) / scale, float(elapsed), float(exported)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--families", type=int, default=50000)
+    args = parser.parse_args()
+
+    results = {}
+    for variant in ("dict", "slots"):
+        records, before, peak, elapsed, exported = run(variant, args.families)
+        results[variant] = peak - before
+        print(f"{variant:<6} {records} records  peak RSS {peak:7.1f} MB "
+              f"(+{peak - before:6.1f} MB for records)  json.dump {elapsed:5.2f} s  export {exported:5.2f} s")
+
+    saved = results["dict"] - results["slots"]
+    print(f"slots use {saved:.1f} MB less ({saved / results['dict'] * 100:.0f}%)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Throughput of the batch normalization stage
+
+Builds a synthetic corpus (families with members_text and detail-page
+contacts, staff and group card text, and events) and times src.normalize
+over it against the per-record parsing the scrapers used to do inline.
+
+    python benchmarks/normalize_throughput.py [--records 50000]
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.calendar_index import parse_month_day  # noqa: E402
+from src.models import Event, Family, Group, Staff  # noqa: E402
+from src.normalize import (  # noqa: E402
+    normalize_events,
+    normalize_families,
+    normalize_groups,
+    normalize_staff,
+)
+
+FIRST_NAMES = ["John", "Mary", "Tim", "Sue", "Ann", "Bob", "Carl", "Dana", "Eve", "Frank"]
+MONTHS = ["January", "February", "March", "April", "May", "June", "July",
+          "August", "September", "October", "November", "December"]
+
+
+def phone(rng):
+    return f"({rng.randint(200, 999)}) {rng.randint(200, 999)}-{rng.randint(1000, 9999)}"
+
+
+def build_corpus(records, seed=1):
+    """Return (families, staff, staff texts, groups, group texts, events), `records` of each."""
+    rng = random.Random(seed)
+    families, staff, staff_texts, groups, group_texts, events = [], [], [], [], [], []
+
+    for i in range(records):
+        names = rng.sample(FIRST_NAMES, rng.randint(1, 4))
+        members_text = ", ".join(names[:-1]) + (" & " if len(names) > 1 else "") + names[-1]
+        families.append(Family(
+            id=f"family_{i:06d}", name=f"Family {i}", members_text=members_text,
+            contact={"emails": [f"Family{i}@Example.org"], "phones": [phone(rng), phone(rng)], "details": ""}
+        ))
+
+        staff.append(Staff(id=f"staff_{i:06d}", name=f"Staff {i}", title="Pastor"))
+        staff_texts.append(f"Staff {i}\nPastor\nstaff{i}@church.org\nOffice: {phone(rng)}")
+
+        groups.append(Group(id=f"group_{i:06d}", name=f"Group {i}"))
+        leaders = " & ".join(rng.sample(FIRST_NAMES, 2))
+        group_texts.append(f"Group {i}\nMeets weekly\nLeaders: {leaders}")
+
+        events.append(Event(kind="birthday", name=f"Person {i}",
+                            date=f"{rng.choice(MONTHS)} {rng.randint(1, 28)}"))
+
+    return families, staff, staff_texts, groups, group_texts, events
+
+
+def per_record_staff(staff, texts):
+    for member, text in zip(staff, texts):
+        email_match = re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)
+        member.email = email_match.group() if email_match else ""
+        phone_match = re.search(r'\b(?:\+?1[-.]?)?\(?([0-9]{3})\)?[-.]?([0-9]{3})[-.]?([0-9]{4})\b', text)
+        member.phone = phone_match.group() if phone_match else ""
+
+
+def per_record_groups(groups, texts):
+    for group, text in zip(groups, texts):
+        if 'leader' in text.lower() or 'led by' in text.lower():
+            leader_match = re.search(r'(?:Leader|Led by):\s*([^\n]+)', text, re.IGNORECASE)
+            if leader_match:
+                group.leaders = [name.strip() for name in leader_match.group(1).split(',')]
+
+
+def per_record_events(events):
+    for event in events:
+        event.month_day = parse_month_day(event.date)
+
+
+# Section -> (inline one-record-at-a-time parsing the scrapers did before,
+# normalization stage); families had no parsing before
+STAGES = {
+    "families": (None, lambda corpus: normalize_families(corpus[0])),
+    "staff": (lambda corpus: per_record_staff(corpus[1], corpus[2]),
+              lambda corpus: normalize_staff(corpus[1], corpus[2])),
+    "groups": (lambda corpus: per_record_groups(corpus[3], corpus[4]),
+               lambda corpus: normalize_groups(corpus[3], corpus[4])),
+    "events": (lambda corpus: per_record_events(corpus[5]),
+               lambda corpus: normalize_events(corpus[5])),
+}
+
+
+def timed(function, records):
+    """Return microseconds per record for one stage on a fresh corpus."""
+    corpus = build_corpus(records)
+    start = time.perf_counter()
+    function(corpus)
+    return (time.perf_counter() - start) / records * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=50000, help="Records per section (default: 50000)")
+    args = parser.parse_args()
+
+    # Per-record cost should stay flat as the corpus grows
+    small = max(args.records // 10, 1)
+    print(f"{'section':<10} {'inline us/rec':>14} {'batch us/rec':>13} "
+          f"{'batch records/s':>16} {f'batch at {small}':>14}")
+    total = 0.0
+    for section, (inline, batch) in STAGES.items():
+        before = f"{timed(inline, args.records):14.2f}" if inline else f"{'-':>14}"
+        after = timed(batch, args.records)
+        total += after
+        print(f"{section:<10} {before} {after:13.2f} {1e6 / after:16,.0f} {timed(batch, small):14.2f}")
+    print(f"{'all':<10} {'':>14} {total:13.2f} {4e6 / total:16,.0f}   ({args.records * 4} records)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
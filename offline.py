@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Offline tools for an existing exports/ tree
+Inspect, convert, verify and query exports without a browser or network.
+
+Only the standard library is imported at startup; each command imports what
+it needs when it runs, so this is cheap enough to call from shell loops.
+"""
+import argparse
+import json
+import os
+import sys
+
+from src.export_reader import (
+    LABEL_FIELDS,
+    SECTION_FILES,
+    PHOTO_SECTIONS,
+    iter_sections,
+    load_section,
+    record_label,
+)
+
+
+def cmd_stats(args):
+    """Print record and photo counts per section."""
+    total = 0
+    for section, records in iter_sections(args.exports):
+        photos = sum(1 for record in records if record.get("photo"))
+        total += len(records)
+        line = f"{section:<15} {len(records):>7} records"
+        if section in PHOTO_SECTIONS:
+            line += f"  {photos:>7} photos"
+        print(line)
+    print(f"{'total':<15} {total:>7} records")
+    return 0
+
+
+def cmd_convert(args):
+    """Convert one section to CSV, JSON Lines, Parquet or Arrow IPC."""
+    records = load_section(args.exports, args.section)
+
+    if args.format in ("parquet", "arrow"):
+        from src.columnar import columnar_path, find_mismatches, read_columnar, write_columnar
+
+        path = args.output or columnar_path(args.exports, args.section, args.format)
+        count = write_columnar(args.section, records, path, args.format)
+        print(f"Wrote {count} {args.section} records to {path}", file=sys.stderr)
+
+        if args.check:
+            mismatches = find_mismatches(records, read_columnar(args.section, path))
+            for mismatch in mismatches[:20]:
+                print(f"mismatch  {mismatch}")
+            print(f"Round trip {'FAILED' if mismatches else 'matches JSON'}", file=sys.stderr)
+            return 1 if mismatches else 0
+        return 0
+
+    output = open(args.output, 'w', encoding='utf-8', newline='') if args.output else sys.stdout
+
+    try:
+        if args.format == "jsonl":
+            for record in records:
+                output.write(json.dumps(record, ensure_ascii=False) + "\n")
+        else:
+            import csv
+
+            fieldnames = []
+            for record in records:
+                for key in record:
+                    if key not in fieldnames:
+                        fieldnames.append(key)
+
+            writer = csv.DictWriter(output, fieldnames=fieldnames)
+            writer.writeheader()
+            for record in records:
+                writer.writerow({
+                    key: json.dumps(value, ensure_ascii=False) if isinstance(value, (dict, list)) else value
+                    for key, value in record.items()
+                })
+    finally:
+        if args.output:
+            output.close()
+
+    if args.output:
+        print(f"Wrote {len(records)} {args.section} records to {args.output}", file=sys.stderr)
+    return 0
+
+
+def cmd_verify(args):
+    """
+    Check the export against its manifest of sizes and SHA-256 hashes.
+
+    Reports missing, corrupt and orphaned files; with --requeue, downloads
+    only the broken assets again.
+    """
+    from src.verify import verify_export
+
+    report = verify_export(args.exports, workers=args.workers)
+    if report.manifest is None:
+        print("No manifest.json in the export, only checking that referenced assets exist", file=sys.stderr)
+
+    for path in report.missing:
+        print(f"missing     {path}")
+    for path, detail in report.corrupt:
+        print(f"corrupt     {path}: {detail}")
+    for path in report.orphaned:
+        print(f"orphaned    {path}")
+    if args.verbose:
+        for path in report.unverified:
+            print(f"unverified  {path}")
+
+    print(
+        f"Checked {report.checked} files ({report.checked_bytes / 1e6:.1f} MB): "
+        f"{len(report.missing)} missing, {len(report.corrupt)} corrupt, "
+        f"{len(report.orphaned)} orphaned, {len(report.unverified)} not in manifest"
+    )
+
+    if args.requeue and not report.ok:
+        import asyncio
+        from src.verify import requeue_broken
+
+        failed = asyncio.run(requeue_broken(report, args.exports))
+        for path, url in sorted(failed.items()):
+            print(f"unrepaired  {path}" + (f" ({url})" if url else " (no source URL, re-run the scraper)"))
+        print(f"Repaired {len(report.broken()) - len(failed)} of {len(report.broken())} files")
+        return 1 if failed else 0
+
+    return 0 if report.ok else 1
+
+
+def cmd_index(args):
+    """Build (or rebuild) the search index of the export."""
+    from src.search_index import build_search_index
+
+    build_search_index(args.exports)
+    return 0
+
+
+def cmd_query(args):
+    """
+    Search record names and titles.
+
+    Uses the prebuilt search index (word-prefix matching) when the export
+    has one, and a case-insensitive substring scan of the JSON otherwise.
+    """
+    from src.search_index import INDEX_FILENAME, INDEXED_FIELDS, open_search_index
+
+    use_index = (
+        not args.scan
+        and (not args.section or args.section in INDEXED_FIELDS)
+        and os.path.exists(os.path.join(args.exports, INDEX_FILENAME))
+    )
+    if use_index:
+        with open_search_index(args.exports) as index:
+            results = index.search(args.text, limit=args.limit, section=args.section)
+        for doc in results:
+            print(f"{doc['section']}\t{doc['id']}\t{doc['label']}")
+        return 0 if results else 1
+
+    needle = args.text.lower()
+    sections = [args.section] if args.section else list(SECTION_FILES)
+    matches = 0
+
+    for section in sections:
+        for record in load_section(args.exports, section):
+            label = record_label(record)
+            haystack = " ".join(
+                str(record.get(field, "")) for field in LABEL_FIELDS + ("members_text",)
+            ).lower()
+            if needle in haystack:
+                print(f"{section}\t{record.get('id', '')}\t{label}")
+                matches += 1
+                if args.limit and matches >= args.limit:
+                    return 0
+
+    return 0 if matches else 1
+
+
+def cmd_upcoming(args):
+    """List birthdays and anniversaries in the next N days."""
+    from src.calendar_index import CalendarIndex
+    from src.export_reader import load_export_file
+
+    calendar = CalendarIndex(load_export_file(args.exports, "events.json"))
+    kinds = (args.kind,) if args.kind else ("birthdays", "anniversaries")
+    events = calendar.upcoming(days=args.days, kinds=kinds)
+
+    singular = {"birthdays": "birthday", "anniversaries": "anniversary"}
+    for day, kind, record in events:
+        print(f"{day.isoformat()}\t{singular[kind]}\t{record_label(record)}")
+    return 0
+
+
+def cmd_site(args):
+    """Build or update the static browse site."""
+    from src.static_site import build_site
+
+    build_site(args.exports, output_dir=args.output, page_size=args.page_size)
+    return 0
+
+
+def positive_int(value):
+    """argparse type for counts that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def build_parser():
+    """Build the command line parser."""
+    parser = argparse.ArgumentParser(description="Offline tools for an existing export")
+    parser.add_argument("--exports", default="exports", help="Export directory (default: exports)")
+    commands = parser.add_subparsers(dest="command")
+    commands.required = True
+
+    stats = commands.add_parser("stats", help="Record and photo counts per section")
+    stats.set_defaults(func=cmd_stats)
+
+    convert = commands.add_parser("convert", help="Convert a section to CSV or JSON Lines")
+    convert.add_argument("section", choices=list(SECTION_FILES))
+    convert.add_argument("--format", choices=["csv", "jsonl", "parquet", "arrow"], default="csv")
+    convert.add_argument("--output", "-o",
+                         help="Output file (default: stdout, or next to the JSON for parquet/arrow)")
+    convert.add_argument("--check", action="store_true",
+                         help="For parquet/arrow, read the file back and compare it with the JSON")
+    convert.set_defaults(func=cmd_convert)
+
+    verify = commands.add_parser("verify", help="Check files against the export manifest")
+    verify.add_argument("--workers", type=int, help="Hashing threads (default: one per CPU)")
+    verify.add_argument("--requeue", action="store_true",
+                        help="Download missing and corrupt assets again")
+    verify.add_argument("--verbose", "-v", action="store_true",
+                        help="Also list referenced files that are not in the manifest")
+    verify.set_defaults(func=cmd_verify)
+
+    index = commands.add_parser("index", help="Build the name search index")
+    index.set_defaults(func=cmd_index)
+
+    query = commands.add_parser("query", help="Search record names and titles")
+    query.add_argument("text")
+    query.add_argument("--section", choices=list(SECTION_FILES))
+    query.add_argument("--limit", type=int, default=0, help="Stop after this many matches")
+    query.add_argument("--scan", action="store_true", help="Scan the JSON even if a search index exists")
+    query.set_defaults(func=cmd_query)
+
+    upcoming = commands.add_parser("upcoming", help="Birthdays and anniversaries in the next N days")
+    upcoming.add_argument("--days", type=int, default=7)
+    upcoming.add_argument("--kind", choices=["birthdays", "anniversaries"])
+    upcoming.set_defaults(func=cmd_upcoming)
+
+    site = commands.add_parser("site", help="Build a static browse site from the export")
+    site.add_argument("--output", "-o", help="Site directory (default: <exports>/site)")
+    site.add_argument("--page-size", type=positive_int, default=50, help="Records per listing page")
+    site.set_defaults(func=cmd_site)
+
+    return parser
+
+
+def main(argv=None):
+    """Offline tools entry point."""
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
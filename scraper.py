@@ -3,22 +3,26 @@
 Instant Church Directory Scraper
 Main entry point for scraping all directory data
 """
+import argparse
 import asyncio
+import json
+import os
 import sys
 from datetime import datetime
 
-from src.auth import get_authenticated_page, AuthenticationError
-from src.exporter import export_to_json, create_export_structure
-from src.downloader import download_asset
-from src.scrapers.families import scrape_families
-from src.scrapers.staff import scrape_staff
-from src.scrapers.groups import scrape_groups
-from src.scrapers.events import scrape_events
-from src.scrapers.pages import scrape_pages
+from src.archive import ArchiveError, finish_archive, get_export_archive, start_archive
+from src.exporter import export_to_json, create_export_structure, write_export_file
+from src.manifest import finish_manifest, save_manifest, start_manifest
+from src.search_index import build_search_index
+
+# Playwright, aiohttp and aiofiles are only imported once a scrape actually
+# starts, so `--help` and the offline tools stay cheap to launch.
 
 
 async def download_photos_for_records(records, photo_key, dest_dir):
     """Download photos for a list of records."""
+    from src.downloader import download_asset
+
     if not records:
         return records
 
@@ -26,31 +30,353 @@ async def download_photos_for_records(records, photo_key, dest_dir):
     downloaded = 0
 
     for record in records:
-        photo_url = record.get(photo_key, "")
+        photo_url = getattr(record, photo_key)
         if photo_url:
             try:
                 local_path = await download_asset(photo_url, dest_dir)
                 if local_path:
-                    record[photo_key] = local_path
+                    setattr(record, photo_key, local_path)
                     downloaded += 1
             except Exception as e:
                 print(f"    Error downloading photo: {str(e)}")
-                record[photo_key] = ""
+                setattr(record, photo_key, "")
 
     print(f"  Downloaded {downloaded} photos")
     return records
 
 
-async def main():
+async def save_photo_section(category, records, dest_dir):
+    """Export a section, then download its photos now or in the photo stage and export it again."""
+    from src.scheduler import get_scheduler
+
+    # Keep the scraped data even if the photos fail or run out of time; the
+    # file is rewritten once photo paths are filled in. Archive entries cannot
+    # be rewritten, so an archive only gets the final file.
+    if not get_export_archive():
+        await export_to_json(category, records)
+
+    scheduler = get_scheduler()
+    if scheduler:
+        # With a deadline, photos wait until every section's data is in
+        scheduler.hold("photos", (category, records, dest_dir))
+        return
+
+    try:
+        records = await download_photos_for_records(records, "photo", dest_dir)
+    finally:
+        await export_to_json(category, records)
+
+
+async def download_held_photos(scheduler):
+    """Photo stage: download held photos within the stage budget, then export their sections."""
+    from src.downloader import download_asset
+
+    held = scheduler.held("photos")
+    # One job per photo, sections in priority order, last run's deferrals first
+    jobs = [(category, record, dest_dir) for category, records, dest_dir in held
+            for record in records if record.photo]
+    jobs.sort(key=lambda job: job[1].photo not in scheduler.previously_deferred)
+
+    print(f"\nDownloading {len(jobs)} photos...")
+    try:
+        results, deferred = await scheduler.run_downloads(
+            "photos", [lambda url=record.photo, dest_dir=dest_dir: download_asset(url, dest_dir)
+                       for _, record, dest_dir in jobs]
+        )
+        for (category, record, _), path in zip(jobs, results):
+            if path:
+                record.photo = path
+        for index in deferred:
+            category, record, _ = jobs[index]
+            scheduler.defer("photos", {"section": category, "id": record.id, "url": record.photo})
+        print(f"  Downloaded {sum(1 for path in results if path)} photos, deferred {len(deferred)}")
+    finally:
+        # Archives only get these sections here, so write them even if the stage failed
+        for category, records, _ in held:
+            await export_to_json(category, records)
+
+
+async def download_held_page_assets(scheduler):
+    """Page asset stage: download held page assets within the stage budget, then export the pages."""
+    from src.downloader import download_asset
+
+    pages = [page_data for held in scheduler.held("page_assets") for page_data in held]
+    if not pages:
+        return
+    urls = scheduler.urgent_first(list(dict.fromkeys(
+        asset["url"] for page_data in pages for asset in page_data.assets if asset["url"]
+    )))
+
+    print(f"\nDownloading {len(urls)} page assets...")
+    results, deferred = await scheduler.run_downloads(
+        "page_assets", [lambda url=url: download_asset(url, "exports/additional_pages/assets") for url in urls]
+    )
+    local_paths = {url: path for url, path in zip(urls, results) if path}
+    for index in deferred:
+        scheduler.defer("page_assets", {"url": urls[index]})
+    print(f"  Downloaded {len(local_paths)} assets, deferred {len(deferred)}")
+
+    for page_data in pages:
+        for asset in page_data.assets:
+            asset["path"] = local_paths.get(asset["url"], "")
+    await export_to_json("additional_pages", pages)
+
+
+async def export_families(page, summary):
+    """Scrape families, download their photos and export to JSON; returns the record count."""
+    from src.scrapers.families import scrape_families
+
+    families = await scrape_families(page)
+    summary["families"] = len(families)
+
+    if families:
+        await save_photo_section("families", families, "exports/families/photos")
+    return len(families)
+
+
+async def export_staff(page, summary):
+    """Scrape staff, download their photos and export to JSON; returns the record count."""
+    from src.scrapers.staff import scrape_staff
+
+    staff = await scrape_staff(page)
+    summary["staff"] = len(staff)
+
+    if staff:
+        await save_photo_section("staff", staff, "exports/staff/photos")
+    return len(staff)
+
+
+async def export_groups(page, summary):
+    """Scrape groups, download their photos and export to JSON; returns the record count."""
+    from src.scrapers.groups import scrape_groups
+
+    groups = await scrape_groups(page)
+    summary["groups"] = len(groups)
+
+    if groups:
+        await save_photo_section("groups", groups, "exports/groups/photos")
+    return len(groups)
+
+
+async def export_events(page, summary):
+    """Scrape birthdays and anniversaries and export them to events.json; returns the record count."""
+    from src.scrapers.events import scrape_events
+    from src.calendar_index import build_calendar_index
+
+    events = await scrape_events(page)
+    summary["birthdays"] = len(events.get("birthdays", []))
+    summary["anniversaries"] = len(events.get("anniversaries", []))
+    total = summary["birthdays"] + summary["anniversaries"]
+
+    # A failed scrape returns empty lists; keep the previous events.json
+    if total:
+        events = {kind: [event.to_dict() for event in records] for kind, records in events.items()}
+
+        # Export to JSON (stored at root level)
+        events_data = {
+            "metadata": {
+                "export_date": datetime.utcnow().isoformat() + "Z",
+                "total_records": total,
+                "source": "https://members.instantchurchdirectory.com"
+            },
+            "birthdays": events.get("birthdays", []),
+            "anniversaries": events.get("anniversaries", []),
+            # "MM-DD" -> positions in the lists above, for upcoming-date lookups
+            "calendar_index": build_calendar_index(events)
+        }
+
+        content = json.dumps(events_data, indent=2, ensure_ascii=False)
+        write_export_file("exports/events.json", content.encode('utf-8'))
+        print(f"  Exported events to exports/events.json")
+    return total
+
+
+async def export_pages(page, summary):
+    """Scrape additional pages, download their assets and export to JSON; returns the record count."""
+    from src.scrapers.pages import scrape_pages
+    from src.downloader import download_assets_batch
+    from src.scheduler import get_scheduler
+
+    pages = await scrape_pages(page)
+    summary["pages"] = len(pages)
+
+    if pages and get_scheduler():
+        # With a deadline, assets wait for their own stage
+        get_scheduler().hold("page_assets", pages)
+    elif pages:
+        # Download assets for all pages in parallel
+        asset_urls = [asset["url"] for page_data in pages for asset in page_data.assets]
+        print(f"  Downloading {len(asset_urls)} assets for {len(pages)} pages...")
+        local_paths = await download_assets_batch(asset_urls, "exports/additional_pages/assets")
+        print(f"  Downloaded {len(local_paths)} assets")
+
+        for page_data in pages:
+            for asset in page_data.assets:
+                asset["path"] = local_paths.get(asset["url"], "")
+
+        # Export to JSON
+        await export_to_json("additional_pages", pages)
+    return len(pages)
+
+
+async def start_sharded_families(page, summary, workers):
+    """
+    Scrape the family list and hand detail pages and photos to worker processes.
+
+    Returns:
+        tuple: (families, queue, worker processes) for finish_sharded_families()
+    """
+    from src.job_queue import JobQueue
+    from src.scrapers.families import scrape_families
+    from src.sharding import QUEUE_FILENAME, enqueue_family_jobs, spawn_workers
+
+    families = await scrape_families(page)
+    summary["families"] = len(families)
+
+    queue = JobQueue(os.path.join("exports", QUEUE_FILENAME))
+    added = enqueue_family_jobs(queue, families, "exports/families/photos")
+    print(f"  Queued {added} new jobs, {queue.remaining()} to do; starting {workers} workers")
+    processes = await spawn_workers(os.path.abspath(__file__), queue.path, workers)
+    return families, queue, processes
+
+
+async def finish_sharded_families(families, queue, processes, summary):
+    """Wait for the workers, merge their results and export the families."""
+    from src.sharding import merge_family_results
+
+    print("\nWaiting for family workers...")
+    for process in processes:
+        await process.wait()
+
+    try:
+        if queue.remaining():
+            # Every worker exited early (e.g. login failed). Keep the family
+            # list, and the queue so the next run merges the details in.
+            await export_to_json("families", families)
+            raise Exception(f"{queue.remaining()} family jobs left unfinished, re-run to resume")
+
+        merged = merge_family_results(queue, families)
+        print(f"  Merged {merged['details']} detail pages and {merged['photos']} photos")
+        for key, error in queue.errors().items():
+            summary["errors"].append(f"Family job failed for {key}: {error}")
+        await export_to_json("families", families)
+    finally:
+        queue.close()
+
+    # All results are in families.json now; start the next run fresh
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(queue.path + suffix):
+            os.remove(queue.path + suffix)
+
+
+# Section name -> exporter, in scrape order
+SECTION_EXPORTERS = {
+    "families": export_families,
+    "staff": export_staff,
+    "groups": export_groups,
+    "events": export_events,
+    "pages": export_pages,
+}
+
+
+def parse_args(argv=None):
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description="Export an Instant Church Directory")
+    parser.add_argument(
+        "--watch", action="store_true",
+        help="Keep running and re-export only sections whose list pages changed"
+    )
+    parser.add_argument(
+        "--interval", type=float, default=300,
+        help="Base poll interval in seconds for --watch (default: 300)"
+    )
+    parser.add_argument(
+        "--max-interval", type=float, default=3600,
+        help="Longest poll interval after backing off in --watch (default: 3600)"
+    )
+    parser.add_argument(
+        "--columnar", choices=["parquet", "arrow"],
+        help="Also write each section as a Parquet or Arrow IPC file (requires pyarrow)"
+    )
+    parser.add_argument(
+        "--archive", metavar="FILE",
+        help="Stream the whole export into a .zip, .tar.gz, .tar.xz or .tar.zst "
+             "archive with a manifest instead of writing exports/"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=0, metavar="N",
+        help="Spread family detail pages and photos over N worker processes, "
+             "each with its own browser (see src.sharding)"
+    )
+    parser.add_argument(
+        "--worker", metavar="QUEUE",
+        help="Run as a worker on an existing job queue, e.g. to add workers from another terminal"
+    )
+    parser.add_argument(
+        "--deadline", type=float, metavar="MINUTES",
+        help="Finish within this many minutes, deferring low-priority work to the next run"
+    )
+    parser.add_argument(
+        "--priority", metavar="STAGES",
+        help="Comma-separated stage order for --deadline, most important first "
+             "(default: families,staff,events,groups,pages,photos,page_assets)"
+    )
+    capture = parser.add_mutually_exclusive_group()
+    capture.add_argument(
+        "--capture", metavar="DIR",
+        help="Record every HTTP exchange of this run to a capture directory"
+    )
+    capture.add_argument(
+        "--replay", metavar="DIR",
+        help="Serve every request from a capture directory instead of the network"
+    )
+    args = parser.parse_args(argv)
+    if args.archive and args.watch:
+        parser.error("--archive cannot be combined with --watch")
+    if args.workers and (args.watch or args.archive or args.capture or args.replay):
+        parser.error("--workers cannot be combined with --watch, --archive, --capture or --replay")
+    if args.deadline is not None and (args.watch or args.workers):
+        parser.error("--deadline cannot be combined with --watch or --workers")
+    if args.priority and args.deadline is None:
+        parser.error("--priority requires --deadline")
+    return args
+
+
+async def main(argv=None):
     """Main scraper function."""
+    args = parse_args(argv)
     start_time = datetime.now()
 
+    if args.worker:
+        from src.sharding import run_worker
+
+        try:
+            await run_worker(args.worker)
+        except Exception as e:
+            print(f"\nWorker failed: {str(e)}")
+            sys.exit(1)
+        return
+
     print("=" * 60)
     print("Instant Church Directory Scraper")
     print("=" * 60)
 
-    # Create export directory structure
-    create_export_structure()
+    if args.deadline is not None:
+        from src.scheduler import DEFAULT_PRIORITY, SchedulerError, start_scheduler
+
+        priority = args.priority.split(",") if args.priority else DEFAULT_PRIORITY
+        try:
+            # The clock starts before logging in: the window covers the whole run
+            start_scheduler(args.deadline * 60, [stage.strip() for stage in priority])
+        except SchedulerError as e:
+            print(f"\n{str(e)}")
+            sys.exit(2)
+
+    if not args.archive:
+        # Create export directory structure
+        create_export_structure()
+        # Record sizes and hashes of everything written, for offline.py verify
+        start_manifest()
 
     page = None
     browser = None
@@ -64,119 +390,122 @@ async def main():
         "errors": []
     }
 
+    from src.auth import get_authenticated_page, AuthenticationError
+    from src.capture import RECORD, REPLAY, CaptureError, start_capture, stop_capture
+
+    capture_dir = args.capture or args.replay
+    capture_mode = RECORD if args.capture else REPLAY if args.replay else None
+
     try:
+        if args.archive:
+            print(f"\nWriting export to archive {args.archive}")
+            start_archive(args.archive)
+
+        if capture_mode:
+            print(f"\n{'Recording to' if capture_mode == RECORD else 'Replaying from'} capture {capture_dir}")
+            start_capture(capture_dir, capture_mode)
+            if capture_mode == REPLAY:
+                from src.scrapers import set_settle_ms
+
+                set_settle_ms(0)
+
         # Authenticate
         print("\nAuthenticating...")
-        page, browser = await get_authenticated_page()
+        page, browser = await get_authenticated_page(capture_dir, capture_mode)
 
-        # Scrape families
-        try:
-            families = await scrape_families(page)
-            summary["families"] = len(families)
-
-            if families:
-                # Download family photos
-                families = await download_photos_for_records(
-                    families, "photo", "exports/families/photos"
-                )
-                # Export to JSON
-                await export_to_json("families", families)
-        except Exception as e:
-            error_msg = f"Error scraping families: {str(e)}"
-            print(f"  {error_msg}")
-            summary["errors"].append(error_msg)
+        from src.downloader import set_browser_context
 
-        # Scrape staff
-        try:
-            staff = await scrape_staff(page)
-            summary["staff"] = len(staff)
-
-            if staff:
-                # Download staff photos
-                staff = await download_photos_for_records(
-                    staff, "photo", "exports/staff/photos"
-                )
-                # Export to JSON
-                await export_to_json("staff", staff)
-        except Exception as e:
-            error_msg = f"Error scraping staff: {str(e)}"
-            print(f"  {error_msg}")
-            summary["errors"].append(error_msg)
+        # Photos and bulletins behind the login are fetched with its cookies
+        set_browser_context(page.context)
 
-        # Scrape groups
-        try:
-            groups = await scrape_groups(page)
-            summary["groups"] = len(groups)
-
-            if groups:
-                # Download group photos
-                groups = await download_photos_for_records(
-                    groups, "photo", "exports/groups/photos"
-                )
-                # Export to JSON
-                await export_to_json("groups", groups)
-        except Exception as e:
-            error_msg = f"Error scraping groups: {str(e)}"
-            print(f"  {error_msg}")
-            summary["errors"].append(error_msg)
+        if args.watch:
+            from src.watcher import watch
 
-        # Scrape events (birthdays & anniversaries)
-        try:
-            events = await scrape_events(page)
-            summary["birthdays"] = len(events.get("birthdays", []))
-            summary["anniversaries"] = len(events.get("anniversaries", []))
-
-            if events:
-                # Export to JSON (stored at root level)
-                import json
-                from pathlib import Path
-
-                events_data = {
-                    "metadata": {
-                        "export_date": datetime.utcnow().isoformat() + "Z",
-                        "total_records": summary["birthdays"] + summary["anniversaries"],
-                        "source": "https://members.instantchurchdirectory.com"
-                    },
-                    "birthdays": events.get("birthdays", []),
-                    "anniversaries": events.get("anniversaries", [])
-                }
-
-                Path("exports").mkdir(parents=True, exist_ok=True)
-                with open("exports/events.json", 'w', encoding='utf-8') as f:
-                    json.dump(events_data, f, indent=2, ensure_ascii=False)
-                print(f"  Exported events to exports/events.json")
-        except Exception as e:
-            error_msg = f"Error scraping events: {str(e)}"
-            print(f"  {error_msg}")
-            summary["errors"].append(error_msg)
+            async def export_section(name):
+                count = await SECTION_EXPORTERS[name](page, summary)
+                build_search_index()
+                save_manifest()
+                return count
+
+            await watch(
+                page,
+                export_section,
+                interval=args.interval,
+                max_interval=args.max_interval
+            )
+            return
+
+        from src.scheduler import DOWNLOAD_STAGES, get_scheduler
+
+        scheduler = get_scheduler()
+        sharded = None
+        for name in (scheduler.section_order(SECTION_EXPORTERS) if scheduler else SECTION_EXPORTERS):
+            exporter = SECTION_EXPORTERS[name]
+            try:
+                if name == "families" and args.workers:
+                    # Workers crawl family details while the other sections run here
+                    sharded = await start_sharded_families(page, summary, args.workers)
+                elif scheduler:
+                    await scheduler.run_section(name, lambda: exporter(page, summary))
+                else:
+                    await exporter(page, summary)
+            except Exception as e:
+                error_msg = f"Error scraping {name}: {str(e)}"
+                print(f"  {error_msg}")
+                summary["errors"].append(error_msg)
+
+        if sharded:
+            try:
+                await finish_sharded_families(*sharded, summary)
+            except Exception as e:
+                error_msg = f"Error merging families: {str(e)}"
+                print(f"  {error_msg}")
+                summary["errors"].append(error_msg)
+
+        if scheduler:
+            stage_runners = {"photos": download_held_photos, "page_assets": download_held_page_assets}
+            for stage in scheduler.stages:
+                if stage not in DOWNLOAD_STAGES:
+                    continue
+                try:
+                    await stage_runners[stage](scheduler)
+                except Exception as e:
+                    error_msg = f"Error downloading {stage}: {str(e)}"
+                    print(f"  {error_msg}")
+                    summary["errors"].append(error_msg)
+
+            summary["deferred"] = scheduler.summary()
+            write_export_file("exports/deferred.json", scheduler.to_json())
 
-        # Scrape additional pages
         try:
-            pages = await scrape_pages(page)
-            summary["pages"] = len(pages)
-
-            if pages:
-                # Download assets for pages
-                print(f"  Downloading assets for {len(pages)} pages...")
-                for page_data in pages:
-                    asset_urls = page_data.get("asset_urls", [])
-                    for asset_url in asset_urls[:10]:  # Limit assets per page
-                        try:
-                            await download_asset(asset_url, "exports/additional_pages/assets")
-                        except:
-                            pass
-
-                # Export to JSON
-                await export_to_json("additional_pages", pages)
+            print("\nBuilding search index...")
+            build_search_index(archive=get_export_archive())
         except Exception as e:
-            error_msg = f"Error scraping pages: {str(e)}"
+            error_msg = f"Error building search index: {str(e)}"
             print(f"  {error_msg}")
             summary["errors"].append(error_msg)
 
+        if args.columnar:
+            try:
+                from src.columnar import export_columnar
+
+                print(f"\nWriting {args.columnar} files...")
+                export_columnar(fmt=args.columnar, archive=get_export_archive())
+            except Exception as e:
+                error_msg = f"Error writing {args.columnar} files: {str(e)}"
+                print(f"  {error_msg}")
+                summary["errors"].append(error_msg)
+
     except AuthenticationError as e:
         print(f"\nAuthentication failed: {str(e)}")
         print("Please check your credentials in the .env file")
         sys.exit(1)
+    except CaptureError as e:
+        print(f"\nCapture error: {str(e)}")
+        sys.exit(1)
+    except ArchiveError as e:
+        print(f"\nArchive error: {str(e)}")
+        sys.exit(1)
     except Exception as e:
         print(f"\nUnexpected error: {str(e)}")
         import traceback
@@ -186,7 +515,23 @@ async def main():
         # Clean up
         if browser:
             print("\nClosing browser...")
+            # Closing the context first flushes a recorded HAR to disk
+            if page:
+                from src.downloader import set_browser_context
+
+                set_browser_context(None)
+                await page.context.close()
             await browser.close()
+        if capture_mode:
+            stop_capture()
+        if args.deadline is not None:
+            from src.scheduler import stop_scheduler
+
+            stop_scheduler()
+        if args.archive:
+            finish_archive()
+        else:
+            finish_manifest()
 
     # Print summary
     end_time = datetime.now()
@@ -204,12 +549,22 @@ async def main():
     print(f"  Anniversaries: {summary['anniversaries']}")
     print(f"  Additional Pages: {summary['pages']}")
 
+    from src.downloader import BROWSER, HTTP, get_backend_counts
+
+    downloads = get_backend_counts()
+    print(f"\nDownloads: {downloads[HTTP]} over HTTP, {downloads[BROWSER]} through the browser session")
+
+    if summary.get("deferred"):
+        print("\nDeferred to the next run (see exports/deferred.json):")
+        for item in summary["deferred"]:
+            print(f"  - {item}")
+
     if summary["errors"]:
         print(f"\nErrors: {len(summary['errors'])}")
         for error in summary["errors"]:
             print(f"  - {error}")
 
-    print(f"\nExported data saved to: exports/")
+    print(f"\nExported data saved to: {args.archive or 'exports/'}")
     print("=" * 60)
 
 
@@ -0,0 +1,157 @@
+"""
+Single-pass compressed archive output (.zip, .tar.gz, .tar.xz, .tar.zst)
+"""
+import io
+import json
+import os
+import time
+from typing import Any, Dict, List, Optional
+
+from src.export_reader import SECTION_FILES
+from src.manifest import MANIFEST_FILENAME, Manifest
+
+# Formats that gain nothing from another compression pass
+PRECOMPRESSED_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.webp', '.pdf', '.zip', '.parquet')
+
+
+class ArchiveError(Exception):
+    """Raised when an archive cannot be created"""
+    pass
+
+
+class ExportArchive:
+    """Write-once compressed archive of an export."""
+
+    def __init__(self, path: str, base_dir: str = "exports"):
+        """
+        Args:
+            path: Archive file to create
+            base_dir: Export directory the archived paths are relative to
+        """
+        self.path = path
+        self.base_dir = base_dir
+        self.manifest = Manifest(base_dir=base_dir)
+        # Export JSON kept in memory so indexes can be built from it later
+        self.documents: Dict[str, bytes] = {}
+        self._zip = None
+        self._tar = None
+        self._raw = None
+        self._compressor = None
+
+        import tarfile
+        import zipfile
+
+        name = path.lower()
+        if name.endswith('.zip'):
+            self._zip = zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_DEFLATED)
+        elif name.endswith(('.tar.gz', '.tgz')):
+            self._tar = tarfile.open(path, 'w:gz')
+        elif name.endswith('.tar.xz'):
+            self._tar = tarfile.open(path, 'w:xz')
+        elif name.endswith(('.tar.zst', '.tar.zstd')):
+            try:
+                import zstandard
+            except ImportError:
+                raise ArchiveError("tar.zst archives require zstandard: pip install zstandard")
+            self._raw = open(path, 'wb')
+            self._compressor = zstandard.ZstdCompressor(threads=-1).stream_writer(self._raw)
+            self._tar = tarfile.open(fileobj=self._compressor, mode='w|')
+        else:
+            raise ArchiveError(f"Unsupported archive type: {path} (use .zip, .tar.gz, .tar.xz or .tar.zst)")
+
+    def arcname(self, filepath: str) -> str:
+        """Map a path under the export directory to its name in the archive."""
+        relative = os.path.relpath(filepath, self.base_dir)
+        if relative.startswith('..'):
+            relative = filepath
+        return relative.replace(os.sep, '/')
+
+    def has(self, filepath: str, source_url: str = "") -> bool:
+        """Return True if the file was already added (from source_url, if given)."""
+        entry = self.manifest.files.get(self.arcname(filepath))
+        if not entry:
+            return False
+        return not source_url or entry.get("url", source_url) == source_url
+
+    def add_bytes(self, filepath: str, data: bytes, source_url: str = "") -> None:
+        """
+        Add one file to the archive.
+
+        Args:
+            filepath: Path the file would have under the export directory
+            data: File contents
+            source_url: URL the file was downloaded from, if any
+        """
+        name = self.arcname(filepath)
+        if name in self.manifest.files:
+            # Entries cannot be replaced; downloads check has() first
+            raise ArchiveError(f"{name} was already written to the archive")
+
+        if self._zip is not None:
+            import zipfile
+
+            info = zipfile.ZipInfo(name, date_time=time.localtime()[:6])
+            info.compress_type = (
+                zipfile.ZIP_STORED if name.lower().endswith(PRECOMPRESSED_EXTENSIONS) else zipfile.ZIP_DEFLATED
+            )
+            self._zip.writestr(info, data)
+        else:
+            import tarfile
+
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mtime = int(time.time())
+            self._tar.addfile(info, io.BytesIO(data))
+
+        self.manifest.add(name, data, source_url)
+        if name.endswith('.json'):
+            self.documents[name] = data
+
+    def add_file(self, filepath: str, source_path: str, source_url: str = "") -> None:
+        """Add a file that already exists on disk (e.g. from an earlier run)."""
+        with open(source_path, 'rb') as f:
+            self.add_bytes(filepath, f.read(), source_url)
+
+    def load_section(self, section: str) -> List[Dict[str, Any]]:
+        """Return the records of a section added earlier (see export_reader.load_section)."""
+        relative_path, key = SECTION_FILES[section]
+        data = self.documents.get(relative_path)
+        return json.loads(data).get(key, []) if data else []
+
+    def close(self) -> None:
+        """Add the manifest and finish the archive."""
+        self.add_bytes(os.path.join(self.base_dir, MANIFEST_FILENAME), self.manifest.to_json())
+
+        if self._zip is not None:
+            self._zip.close()
+        else:
+            self._tar.close()
+            if self._compressor is not None:
+                self._compressor.close()
+                if not self._raw.closed:
+                    self._raw.close()
+        print(f"  Wrote {len(self.manifest.files)} files to {self.path}")
+
+
+# Archive the exporter and downloader write to, set by start_archive()
+_export_archive: Optional[ExportArchive] = None
+
+
+def get_export_archive() -> Optional[ExportArchive]:
+    """Return the active archive, or None when writing to the export directory."""
+    return _export_archive
+
+
+def start_archive(path: str, base_dir: str = "exports") -> ExportArchive:
+    """Route all export output into a new archive."""
+    global _export_archive
+    _export_archive = ExportArchive(path, base_dir)
+    return _export_archive
+
+
+def finish_archive() -> None:
+    """Close the active archive and return to writing the export directory."""
+    global _export_archive
+    if _export_archive:
+        _export_archive.close()
+    _export_archive = None
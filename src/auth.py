@@ -2,7 +2,7 @@
 Authentication module for Instant Church Directory
 """
 import os
-from typing import Tuple
+from typing import Optional, Tuple
 from dotenv import load_dotenv
 from playwright.async_api import async_playwright, Page, Browser
 
@@ -14,10 +14,18 @@ class AuthenticationError(Exception):
     pass
 
 
-async def get_authenticated_page() -> Tuple[Page, Browser]:
+async def get_authenticated_page(
+    capture_dir: Optional[str] = None,
+    capture_mode: Optional[str] = None
+) -> Tuple[Page, Browser]:
     """
     Authenticate with Instant Church Directory and return authenticated page.
 
+    Args:
+        capture_dir: Capture directory to record to or replay from
+        capture_mode: "record" or "replay" (see src.capture), or None to
+            use the network directly
+
     Returns:
         tuple[Page, Browser]: Authenticated page and browser instance
 
@@ -36,6 +44,10 @@ async def get_authenticated_page() -> Tuple[Page, Browser]:
     playwright = await async_playwright().start()
     browser = await playwright.chromium.launch(headless=True)
     context = await browser.new_context()
+    if capture_dir and capture_mode:
+        from src.capture import attach_browser_capture
+
+        await attach_browser_capture(context, capture_dir, capture_mode)
     page = await context.new_page()
 
     try:
@@ -0,0 +1,151 @@
+"""
+Month-day calendar index for birthdays and anniversaries
+"""
+import re
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+EVENT_KINDS = ("birthdays", "anniversaries")
+
+MONTHS = {
+    name: idx
+    for idx, names in enumerate([
+        ("january", "jan"), ("february", "feb"), ("march", "mar"),
+        ("april", "apr"), ("may",), ("june", "jun"), ("july", "jul"),
+        ("august", "aug"), ("september", "sep", "sept"), ("october", "oct"),
+        ("november", "nov"), ("december", "dec"),
+    ], start=1)
+    for name in names
+}
+
+_ISO_DATE = re.compile(r'\b\d{4}-(\d{1,2})-(\d{1,2})\b')
+_NUMERIC_DATE = re.compile(r'\b(\d{1,2})/(\d{1,2})(?:/\d{2,4})?\b')
+_MONTH_FIRST = re.compile(r'\b([A-Za-z]{3,9})\.?\s+(\d{1,2})(?:st|nd|rd|th)?\b')
+_DAY_FIRST = re.compile(r'\b(\d{1,2})(?:st|nd|rd|th)?\s+([A-Za-z]{3,9})\b')
+
+# (pattern, month group, day group), tried in this order
+_DATE_PATTERNS = (
+    (_ISO_DATE, 1, 2),
+    (_NUMERIC_DATE, 1, 2),
+    (_MONTH_FIRST, 1, 2),
+    (_DAY_FIRST, 2, 1),
+)
+
+
+def _month_day(month: int, day: int) -> str:
+    try:
+        # Leap year so that February 29 is accepted
+        date(2000, month, day)
+    except ValueError:
+        return ""
+    return f"{month:02d}-{day:02d}"
+
+
+def parse_month_day(text: str) -> str:
+    """
+    Normalize a displayed event date to "MM-DD".
+
+    Accepts forms such as "January 5", "Jan 5, 1980", "5 January", "1/5",
+    "1/5/1980" and "1980-01-05". US month/day order is assumed for numeric
+    dates.
+
+    Args:
+        text: Date text as shown in the directory
+
+    Returns:
+        str: "MM-DD", or "" if no date could be recognized
+    """
+    if not text:
+        return ""
+
+    # Every candidate is tried: "Married 25 years on June 3" first offers "Married 25"
+    for pattern, month_group, day_group in _DATE_PATTERNS:
+        for match in pattern.finditer(text):
+            month = match.group(month_group)
+            if month.isdigit():
+                month_day = _month_day(int(month), int(match.group(day_group)))
+            elif month.lower() in MONTHS:
+                month_day = _month_day(MONTHS[month.lower()], int(match.group(day_group)))
+            else:
+                continue
+            if month_day:
+                return month_day
+
+    return ""
+
+
+def build_calendar_index(events: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Dict[str, List[int]]]:
+    """
+    Build a month-day index over birthdays and anniversaries.
+
+    Args:
+        events: Dict with 'birthdays' and 'anniversaries' lists whose records
+            carry a 'month_day' field
+
+    Returns:
+        dict: "MM-DD" -> {kind: [positions in that kind's list]}, sorted by key
+    """
+    index: Dict[str, Dict[str, List[int]]] = {}
+    for kind in EVENT_KINDS:
+        for position, record in enumerate(events.get(kind, [])):
+            month_day = record.get("month_day") or parse_month_day(record.get("date", ""))
+            if month_day:
+                index.setdefault(month_day, {}).setdefault(kind, []).append(position)
+    return dict(sorted(index.items()))
+
+
+class CalendarIndex:
+    """Query API over an events export and its month-day index."""
+
+    def __init__(self, events: Dict[str, Any]):
+        """
+        Args:
+            events: Parsed events.json contents. The stored 'calendar_index'
+                is used when present and rebuilt otherwise.
+        """
+        self.events = {kind: events.get(kind, []) for kind in EVENT_KINDS}
+        self.index = events.get("calendar_index") or build_calendar_index(self.events)
+
+    def on(self, month_day: str, kinds: Tuple[str, ...] = EVENT_KINDS) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Return the events falling on one "MM-DD".
+
+        Returns:
+            list: (kind, record) pairs
+        """
+        entry = self.index.get(month_day, {})
+        return [
+            (kind, self.events[kind][position])
+            for kind in kinds
+            for position in entry.get(kind, [])
+        ]
+
+    def upcoming(
+        self,
+        days: int = 7,
+        start: Optional[date] = None,
+        kinds: Tuple[str, ...] = EVENT_KINDS
+    ) -> List[Tuple[date, str, Dict[str, Any]]]:
+        """
+        Return the events in the next `days` days, starting with `start`.
+
+        February 29 events are listed on February 28 in non-leap years.
+
+        Args:
+            days: Number of days to look ahead, including the start day
+            start: First day (defaults to today)
+            kinds: Event kinds to include
+
+        Returns:
+            list: (date, kind, record) tuples in date order
+        """
+        start = start or date.today()
+        results = []
+        for offset in range(days):
+            day = start + timedelta(days=offset)
+            month_days = [f"{day.month:02d}-{day.day:02d}"]
+            if day.month == 2 and day.day == 28 and (day + timedelta(days=1)).month == 3:
+                month_days.append("02-29")
+            for month_day in month_days:
+                results.extend((day, kind, record) for kind, record in self.on(month_day, kinds))
+        return results
@@ -0,0 +1,133 @@
+"""
+Record-and-replay capture of a scraping session
+"""
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+RECORD = "record"
+REPLAY = "replay"
+
+HAR_FILENAME = "browser.har"
+
+
+class CaptureError(Exception):
+    """Raised when a capture is missing or cannot be used"""
+    pass
+
+
+class HttpArchive:
+    """URL-keyed store of HTTP responses fetched outside the browser."""
+
+    def __init__(self, capture_dir: str, mode: str):
+        """
+        Args:
+            capture_dir: Capture directory
+            mode: RECORD or REPLAY
+        """
+        self.mode = mode
+        self.http_dir = os.path.join(capture_dir, "http")
+        self.bodies_dir = os.path.join(self.http_dir, "bodies")
+        self.index_path = os.path.join(self.http_dir, "index.json")
+        self.entries: Dict[str, Dict[str, Any]] = {}
+
+        if os.path.exists(self.index_path):
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+        elif mode == REPLAY:
+            print(f"  Warning: No HTTP responses captured in {capture_dir}")
+
+    def lookup(self, url: str) -> Optional[Tuple[int, str, bytes]]:
+        """
+        Return the captured (status, content type, body) for a URL.
+
+        Returns:
+            tuple or None: None if the URL was never captured
+        """
+        entry = self.entries.get(url)
+        if not entry:
+            return None
+        with open(os.path.join(self.bodies_dir, entry["body"]), 'rb') as f:
+            return entry["status"], entry["content_type"], f.read()
+
+    def store(self, url: str, status: int, content_type: str, body: bytes) -> None:
+        """Add or replace the captured response for a URL."""
+        Path(self.bodies_dir).mkdir(parents=True, exist_ok=True)
+        body_name = hashlib.sha256(url.encode()).hexdigest()
+        with open(os.path.join(self.bodies_dir, body_name), 'wb') as f:
+            f.write(body)
+        self.entries[url] = {"status": status, "content_type": content_type, "body": body_name}
+
+    def save(self) -> None:
+        """Write the index (record mode only)."""
+        if self.mode != RECORD:
+            return
+        Path(self.http_dir).mkdir(parents=True, exist_ok=True)
+        with open(self.index_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, indent=2)
+
+
+# Archive used by the downloader, set by start_capture()
+_http_archive: Optional[HttpArchive] = None
+
+
+def get_http_archive() -> Optional[HttpArchive]:
+    """Return the active HTTP archive, or None when not capturing."""
+    return _http_archive
+
+
+def start_capture(capture_dir: str, mode: str) -> HttpArchive:
+    """
+    Activate capture for the downloader.
+
+    Args:
+        capture_dir: Capture directory
+        mode: RECORD or REPLAY
+
+    Returns:
+        HttpArchive: The activated archive
+
+    Raises:
+        CaptureError: If replaying a capture that does not exist
+    """
+    global _http_archive
+
+    if mode not in (RECORD, REPLAY):
+        raise CaptureError(f"Unknown capture mode: {mode}")
+    if mode == REPLAY and not os.path.exists(os.path.join(capture_dir, HAR_FILENAME)):
+        raise CaptureError(f"No capture found at {capture_dir}")
+
+    Path(capture_dir).mkdir(parents=True, exist_ok=True)
+    _http_archive = HttpArchive(capture_dir, mode)
+    return _http_archive
+
+
+def stop_capture() -> None:
+    """Save and deactivate the downloader archive."""
+    global _http_archive
+
+    if _http_archive:
+        _http_archive.save()
+        print(f"  Captured {len(_http_archive.entries)} HTTP responses")
+    _http_archive = None
+
+
+async def attach_browser_capture(context, capture_dir: str, mode: str) -> None:
+    """
+    Route a Playwright browser context through the capture HAR.
+
+    In record mode the HAR is written when the context is closed, so close
+    the context before the browser.
+
+    Args:
+        context: Playwright BrowserContext
+        capture_dir: Capture directory
+        mode: RECORD or REPLAY
+    """
+    har_path = os.path.join(capture_dir, HAR_FILENAME)
+    if mode == RECORD:
+        await context.route_from_har(har_path, update=True, update_content="embed", update_mode="full")
+    else:
+        await context.route_from_har(har_path, not_found="abort")
@@ -0,0 +1,246 @@
+"""
+Columnar (Parquet / Arrow IPC) export of sections
+"""
+import json
+import os
+import tempfile
+from typing import Any, Dict, Iterable, Iterator, List
+
+from src.export_reader import SECTION_FILES, load_section
+from src.manifest import record_export_file
+
+FORMATS = {"parquet": ".parquet", "arrow": ".arrow"}
+
+DEFAULT_BATCH_SIZE = 10000
+
+# Fields stored as JSON text because their keys are not fixed
+JSON_FIELDS = {"families": ("contact",)}
+
+
+class ColumnarExportError(Exception):
+    """Raised when a columnar export cannot be written or read"""
+    pass
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError:
+        raise ColumnarExportError("Columnar export requires pyarrow: pip install pyarrow")
+    return pyarrow
+
+
+def section_schema(section: str):
+    """
+    Return the Arrow schema of a section.
+
+    Raises:
+        ColumnarExportError: If pyarrow is missing or the section is unknown
+    """
+    pa = _pyarrow()
+    text = pa.string()
+    repeated = pa.dictionary(pa.int32(), pa.string())
+
+    schemas = {
+        "families": [
+            ("id", text), ("name", text), ("members_text", text),
+            ("members", pa.list_(pa.struct([("name", text), ("email", text), ("phone", text)]))),
+            ("photo", text), ("detail_url", text), ("contact", text),
+        ],
+        "staff": [
+            ("id", text), ("name", text), ("title", repeated),
+            ("email", text), ("phone", text), ("photo", text),
+        ],
+        "groups": [
+            ("id", text), ("name", text), ("description", text),
+            ("leaders", pa.list_(text)), ("photo", text),
+        ],
+        "birthdays": [("name", text), ("date", repeated), ("month_day", repeated)],
+        "anniversaries": [("family", text), ("date", repeated), ("month_day", repeated)],
+        "pages": [
+            ("id", text), ("title", text), ("url", text), ("content", text),
+            ("assets", pa.list_(pa.struct([("url", text), ("path", text)]))),
+        ],
+    }
+    if section not in schemas:
+        raise ColumnarExportError(f"No columnar schema for section: {section}")
+    return pa.schema(schemas[section])
+
+
+def _batches(records: Iterable[Any], batch_size: int) -> Iterator[List[Dict[str, Any]]]:
+    batch = []
+    for record in records:
+        # Copy dicts: JSON fields are encoded in place below
+        batch.append(dict(record) if isinstance(record, dict) else record.to_dict())
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def write_columnar(
+    section: str,
+    records: Iterable[Any],
+    path: str,
+    fmt: str = "parquet",
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> int:
+    """
+    Write section records to a Parquet or Arrow IPC file.
+
+    Args:
+        section: Section name (selects the schema)
+        records: Record objects or export dicts
+        path: Output file
+        fmt: "parquet" or "arrow"
+        batch_size: Records per row group / record batch
+
+    Returns:
+        int: Number of records written
+    """
+    if fmt not in FORMATS:
+        raise ColumnarExportError(f"Unknown columnar format: {fmt}")
+
+    pa = _pyarrow()
+    schema = section_schema(section)
+    json_fields = JSON_FIELDS.get(section, ())
+
+    tmp_path = path + ".tmp"
+    if fmt == "parquet":
+        writer = pa.parquet.ParquetWriter(tmp_path, schema, compression="zstd")
+    else:
+        # Batches share one growing dictionary per field, so later batches
+        # only need to append new values
+        options = pa.ipc.IpcWriteOptions(emit_dictionary_deltas=True)
+        writer = pa.ipc.new_file(tmp_path, schema, options=options)
+
+    # Dictionary field -> value -> index, shared by all batches
+    vocabularies: Dict[str, Dict[str, int]] = {
+        field.name: {} for field in schema if pa.types.is_dictionary(field.type)
+    }
+
+    total = 0
+    try:
+        for batch in _batches(records, batch_size):
+            for record in batch:
+                for field in json_fields:
+                    record[field] = json.dumps(record.get(field) or {}, ensure_ascii=False)
+
+            columns = []
+            for field in schema:
+                values = [record.get(field.name) for record in batch]
+                if field.name in vocabularies:
+                    vocabulary = vocabularies[field.name]
+                    indices = [None if value is None else vocabulary.setdefault(value, len(vocabulary))
+                               for value in values]
+                    columns.append(pa.DictionaryArray.from_arrays(
+                        pa.array(indices, pa.int32()), pa.array(list(vocabulary), pa.string())
+                    ))
+                else:
+                    columns.append(pa.array(values, type=field.type))
+
+            writer.write_table(pa.Table.from_arrays(columns, schema=schema))
+            total += len(batch)
+    finally:
+        writer.close()
+
+    os.replace(tmp_path, path)
+    return total
+
+
+def read_columnar(section: str, path: str) -> List[Dict[str, Any]]:
+    """
+    Read a columnar section file back into export dicts.
+
+    Args:
+        section: Section name
+        path: Parquet or Arrow IPC file
+
+    Returns:
+        list: Records in the same shape as the JSON export
+    """
+    pa = _pyarrow()
+    if path.endswith(FORMATS["arrow"]):
+        with pa.memory_map(path) as source:
+            table = pa.ipc.open_file(source).read_all()
+    else:
+        table = pa.parquet.read_table(path)
+
+    records = table.to_pylist()
+    for record in records:
+        for field in JSON_FIELDS.get(section, ()):
+            record[field] = json.loads(record[field]) if record.get(field) else {}
+    return records
+
+
+def find_mismatches(expected: List[Dict[str, Any]], actual: List[Dict[str, Any]]) -> List[str]:
+    """
+    Compare records read back from a columnar file with the JSON records.
+
+    Returns:
+        list: Human-readable differences (empty if the round trip matched)
+    """
+    if len(expected) != len(actual):
+        return [f"record count {len(actual)} != {len(expected)}"]
+
+    mismatches = []
+    for position, (want, got) in enumerate(zip(expected, actual)):
+        for field, value in want.items():
+            if got.get(field) != value:
+                mismatches.append(f"record {position} field {field}: {got.get(field)!r} != {value!r}")
+    return mismatches
+
+
+def columnar_path(base_dir: str, section: str, fmt: str) -> str:
+    """Return where a section's columnar file lives, next to its JSON file."""
+    relative_path, _ = SECTION_FILES[section]
+    directory = os.path.join(base_dir, os.path.dirname(relative_path))
+    return os.path.join(directory, section + FORMATS[fmt])
+
+
+def export_columnar(
+    base_dir: str = "exports",
+    fmt: str = "parquet",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    archive=None
+) -> Dict[str, str]:
+    """
+    Write a columnar copy of every exported section.
+
+    Args:
+        base_dir: Export directory
+        fmt: "parquet" or "arrow"
+        batch_size: Records per row group / record batch
+        archive: Active ExportArchive to read the export from and add the
+            files to, instead of the export directory
+
+    Returns:
+        dict: Section -> written file path
+    """
+    written = {}
+    for section in SECTION_FILES:
+        records = archive.load_section(section) if archive else load_section(base_dir, section)
+        if not records:
+            continue
+        path = columnar_path(base_dir, section, fmt)
+
+        if archive:
+            # pyarrow writes to a path, so stage the file briefly
+            fd, tmp_path = tempfile.mkstemp(suffix=FORMATS[fmt])
+            os.close(fd)
+            try:
+                count = write_columnar(section, records, tmp_path, fmt, batch_size)
+                archive.add_file(path, tmp_path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+        else:
+            count = write_columnar(section, records, path, fmt, batch_size)
+            record_export_file(path)
+
+        print(f"  Exported {count} {section} records to {path}")
+        written[section] = path
+    return written
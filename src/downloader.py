@@ -1,19 +1,106 @@
 """
-Asset downloader with deduplication
+Asset downloader with deduplication and resumable transfers
 """
 import os
 import hashlib
+import mimetypes
+import re
 from pathlib import Path
 from urllib.parse import urlparse
 from typing import List, Dict, Optional
 import aiohttp
 import aiofiles
 
+from src.archive import get_export_archive
+from src.capture import RECORD, REPLAY, get_http_archive
+from src.manifest import get_export_manifest, record_existing_file, record_export_file
+
+CHUNK_SIZE = 64 * 1024
+
+# Next to a ".part" file: the ETag or Last-Modified it was downloaded under,
+# sent as If-Range when resuming so a changed file is not spliced
+VALIDATOR_SUFFIX = ".validator"
+
+# Download backends
+HTTP = "http"
+BROWSER = "browser"
+
+# Asset hosts that only serve logged-in sessions. Hosts answering 401/403
+# to the plain HTTP backend are added at runtime.
+AUTH_HOSTS = {"members.instantchurchdirectory.com"}
+
+BROWSER_TIMEOUT_MS = 60000
+
+# Returned by the HTTP backend when the asset needs the login cookies
+AUTH_REQUIRED = object()
+
+# Authenticated Playwright context, set by set_browser_context()
+_browser_context = None
+
+# Downloads served by each backend this run
+_backend_counts = {HTTP: 0, BROWSER: 0}
+
+
+def set_browser_context(context) -> None:
+    """
+    Let downloads use a logged-in Playwright browser context.
+
+    Assets on AUTH_HOSTS, and assets the plain HTTP backend is refused
+    (401/403), are then fetched through the context's request API, which
+    shares its cookies and connections. Pass None before closing the context.
+
+    Args:
+        context: Playwright BrowserContext, or None
+    """
+    global _browser_context
+    _browser_context = context
+
+
+def get_backend_counts() -> Dict[str, int]:
+    """Return how many downloads each backend (HTTP, BROWSER) served."""
+    return dict(_backend_counts)
+
+
+def asset_filename(url: str) -> str:
+    """
+    Return the file name an asset URL is saved under.
+
+    The URL's base name gets a short hash of the full URL, so two assets
+    with the same name (e.g. two "bulletin.pdf") never share a file.
+    """
+    url_hash = hashlib.sha256(url.encode()).hexdigest()[:12]
+    filename = os.path.basename(urlparse(url).path)
+
+    # If no filename, create one from hash
+    if not filename or '.' not in filename:
+        return f"asset_{url_hash}.jpg"
+    stem, extension = os.path.splitext(filename)
+    return f"{stem}_{url_hash}{extension}"
+
 
 async def download_asset(url: str, destination_dir: str, session: Optional[aiohttp.ClientSession] = None) -> str:
     """
     Download an asset from a URL to the destination directory.
-    Uses SHA-256 hash of URL for deduplication.
+    Uses SHA-256 hash of URL for deduplication (see asset_filename).
+
+    Data is streamed to a ".part" file that is renamed once complete. If a
+    previous attempt or run left a partial file, the download resumes with
+    an HTTP Range request guarded by If-Range, so a file that changed in the
+    meantime is downloaded whole; servers that ignore the range get a full
+    restart. Partial files without a recorded ETag or Last-Modified, or
+    that do not match the remote size, are discarded and downloaded again.
+
+    When an export archive is active (see src.archive) the asset goes
+    straight into the archive instead and nothing is written to disk.
+    Otherwise every completed file is recorded in the export manifest (see
+    src.manifest); a transfer shorter than its Content-Length is retried
+    rather than recorded.
+
+    While recording a capture (see src.capture), files kept from an earlier
+    run are stored in it too, so replaying into a fresh tree finds them.
+
+    Once set_browser_context() was called, assets that need the login are
+    fetched through the browser context instead of aiohttp.
 
     Args:
         url: URL of the asset to download
@@ -29,25 +116,58 @@ async def download_asset(url: str, destination_dir: str, session: Optional[aioht
     if not url:
         return ""
 
-    # Create destination directory
-    Path(destination_dir).mkdir(parents=True, exist_ok=True)
+    export_archive = get_export_archive()
+    if not export_archive:
+        # Create destination directory
+        Path(destination_dir).mkdir(parents=True, exist_ok=True)
 
-    # Extract filename from URL
     parsed_url = urlparse(url)
-    filename = os.path.basename(parsed_url.path)
-
-    # If no filename, create one from hash
-    if not filename or '.' not in filename:
-        url_hash = hashlib.sha256(url.encode()).hexdigest()[:12]
-        filename = f"asset_{url_hash}.jpg"
-
-    filepath = os.path.join(destination_dir, filename)
+    filepath = os.path.join(destination_dir, asset_filename(url))
 
     # Check if already downloaded
-    if os.path.exists(filepath):
+    if export_archive and export_archive.has(filepath, url):
+        return filepath
+    manifest = get_export_manifest()
+    capture = get_http_archive()
+    if os.path.exists(filepath) and not (manifest and manifest.has_other_source(filepath, url)):
+        if capture and capture.mode == RECORD and url not in capture.entries:
+            # Kept from an earlier run: still capture it so a replay into a fresh tree finds it
+            with open(filepath, 'rb') as f:
+                capture.store(url, 200, mimetypes.guess_type(filepath)[0] or "", f.read())
+        if export_archive:
+            # Reuse a download from an earlier directory export
+            export_archive.add_file(filepath, filepath, url)
+        else:
+            record_existing_file(filepath, url)
+        return filepath
+
+    # Serve from a replayed capture without touching the network
+    if capture and capture.mode == REPLAY:
+        captured = capture.lookup(url)
+        if not captured or captured[0] != 200:
+            print(f"  Warning: {url} not in capture")
+            return ""
+        if export_archive:
+            _archive_download(export_archive, filepath, captured[2], url)
+        else:
+            async with aiofiles.open(filepath, 'wb') as f:
+                await f.write(captured[2])
+            record_export_file(filepath, captured[2], url)
         return filepath
 
-    # Download with retries
+    if _browser_context is not None and parsed_url.hostname in AUTH_HOSTS:
+        return await _download_browser(url, filepath, export_archive, capture)
+
+    result = await _download_http(url, filepath, session, export_archive, capture)
+    if result is AUTH_REQUIRED:
+        # Remember the host so its other assets skip the failing request
+        AUTH_HOSTS.add(parsed_url.hostname)
+        return await _download_browser(url, filepath, export_archive, capture)
+    return result
+
+
+async def _download_http(url, filepath, session, export_archive, capture):
+    # Plain aiohttp backend; returns the path, "" on failure, or AUTH_REQUIRED
     max_retries = 3
     own_session = session is None
 
@@ -55,13 +175,71 @@ async def download_asset(url: str, destination_dir: str, session: Optional[aioht
         if own_session:
             session = aiohttp.ClientSession()
 
+        part_path = filepath + ".part"
+        # Large bulletins can take a while: only time out on a stalled read
+        timeout = aiohttp.ClientTimeout(total=None, sock_connect=30, sock_read=30)
+
         for attempt in range(max_retries):
             try:
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as response:
-                    if response.status == 200:
+                offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+                validator = _read_validator(part_path) if offset else ""
+                if offset and not validator:
+                    # Nothing to tell whether the file changed since: start over
+                    _discard_partial(part_path)
+                    offset = 0
+                headers = {}
+                if offset:
+                    # If-Range: the server sends the whole new file if it changed
+                    headers = {"Range": f"bytes={offset}-", "If-Range": validator}
+
+                if export_archive:
+                    headers = {}
+
+                async with session.get(url, headers=headers, timeout=timeout) as response:
+                    if response.status in (401, 403) and _browser_context is not None:
+                        # Retrying without the login cookies cannot succeed
+                        return AUTH_REQUIRED
+                    if export_archive and response.status == 200:
+                        # Archive mode: keep the body in memory, write it once
                         content = await response.read()
-                        async with aiofiles.open(filepath, 'wb') as f:
-                            await f.write(content)
+                        _archive_download(export_archive, filepath, content, url)
+                        if capture:
+                            capture.store(url, 200, response.content_type, content)
+                        _backend_counts[HTTP] += 1
+                        return filepath
+                    if response.status == 416 and offset:
+                        if _content_range_total(response.headers.get('Content-Range', '')) != offset:
+                            # Longer than the remote file (or no size given): start over
+                            _discard_partial(part_path)
+                            raise Exception("Partial download does not match the remote size")
+                        # Range past the end: the partial file is already complete
+                        _forget_validator(part_path)
+                        os.replace(part_path, filepath)
+                        await _record_download(filepath, url)
+                        _backend_counts[HTTP] += 1
+                        return filepath
+                    if response.status in (200, 206):
+                        mode = 'ab' if response.status == 206 else 'wb'
+                        if mode == 'wb':
+                            _write_validator(part_path, response.headers)
+                        received = 0
+                        async with aiofiles.open(part_path, mode) as f:
+                            async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                                await f.write(chunk)
+                                received += len(chunk)
+                        # Content-Length counts encoded bytes, so only compare identity bodies
+                        expected = response.content_length
+                        encoded = response.headers.get('Content-Encoding', 'identity') != 'identity'
+                        if expected is not None and not encoded and received != expected:
+                            # Keep the partial file so the retry resumes it
+                            raise Exception(f"Incomplete transfer ({received} of {expected} bytes)")
+                        _forget_validator(part_path)
+                        os.replace(part_path, filepath)
+                        await _record_download(filepath, url)
+                        if capture:
+                            with open(filepath, 'rb') as f:
+                                capture.store(url, 200, response.content_type, f.read())
+                        _backend_counts[HTTP] += 1
                         return filepath
                     else:
                         print(f"  Warning: Failed to download {url} - Status {response.status}")
@@ -81,26 +259,126 @@ async def download_asset(url: str, destination_dir: str, session: Optional[aioht
     return ""
 
 
-async def download_assets_batch(urls: List[str], destination_dir: str) -> Dict[str, str]:
+async def _download_browser(url, filepath, export_archive, capture) -> str:
+    # Browser backend: the logged-in context's request API sends its cookies
+    # and reuses its connections. Bodies arrive whole, so there is no resume.
+    max_retries = 3
+
+    for attempt in range(max_retries):
+        try:
+            response = await _browser_context.request.get(url, timeout=BROWSER_TIMEOUT_MS)
+            try:
+                if not response.ok:
+                    print(f"  Warning: Failed to download {url} through the browser - Status {response.status}")
+                    if response.status in (401, 403, 404) or attempt == max_retries - 1:
+                        return ""
+                    continue
+                content = await response.body()
+                content_type = response.headers.get("content-type", "").split(";")[0]
+            finally:
+                await response.dispose()
+        except Exception as e:
+            if attempt < max_retries - 1:
+                print(f"  Retry {attempt + 1}/{max_retries} for {url}")
+                continue
+            print(f"  Error downloading {url}: {str(e)}")
+            return ""
+
+        if export_archive:
+            _archive_download(export_archive, filepath, content, url)
+        else:
+            part_path = filepath + ".part"
+            async with aiofiles.open(part_path, 'wb') as f:
+                await f.write(content)
+            os.replace(part_path, filepath)
+            record_export_file(filepath, content, url)
+        if capture:
+            capture.store(url, 200, content_type, content)
+        _backend_counts[BROWSER] += 1
+        return filepath
+
+    return ""
+
+
+def _read_validator(part_path: str) -> str:
+    # ETag or Last-Modified of the response a .part file came from, or ""
+    try:
+        with open(part_path + VALIDATOR_SUFFIX, 'r', encoding='utf-8') as f:
+            return f.read().strip()
+    except OSError:
+        return ""
+
+
+def _write_validator(part_path: str, headers) -> None:
+    # If-Range needs a strong ETag; Last-Modified is the fallback
+    etag = headers.get('ETag', '')
+    validator = etag if etag and not etag.startswith('W/') else headers.get('Last-Modified', '')
+    if validator:
+        with open(part_path + VALIDATOR_SUFFIX, 'w', encoding='utf-8') as f:
+            f.write(validator)
+    else:
+        _forget_validator(part_path)
+
+
+def _forget_validator(part_path: str) -> None:
+    if os.path.exists(part_path + VALIDATOR_SUFFIX):
+        os.remove(part_path + VALIDATOR_SUFFIX)
+
+
+def _discard_partial(part_path: str) -> None:
+    # Drops a partial download that cannot be resumed
+    for path in (part_path, part_path + VALIDATOR_SUFFIX):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def _content_range_total(content_range: str) -> Optional[int]:
+    # Complete length from "bytes */N" (416) or "bytes a-b/N"
+    match = re.match(r'bytes (?:\*|\d+-\d+)/(\d+)', content_range.strip())
+    return int(match.group(1)) if match else None
+
+
+def _archive_download(export_archive, filepath: str, data: bytes, url: str) -> None:
+    # Concurrent downloads of the same URL (e.g. a shared placeholder photo) add it once
+    if not export_archive.has(filepath, url):
+        export_archive.add_bytes(filepath, data, url)
+
+
+async def _record_download(filepath: str, url: str) -> None:
+    # Hash off the event loop: bulletins can be large
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, record_export_file, filepath, None, url)
+
+
+async def download_assets_batch(
+    urls: List[str],
+    destination_dir: str,
+    max_concurrency: int = 8
+) -> Dict[str, str]:
     """
     Download multiple assets in parallel.
 
     Args:
         urls: List of URLs to download
         destination_dir: Directory to save assets
+        max_concurrency: Maximum number of downloads in flight
 
     Returns:
         dict: Mapping of original URLs to local file paths
     """
+    urls = list(dict.fromkeys(url for url in urls if url))
     if not urls:
         return {}
 
     results = {}
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def bounded_download(url):
+        async with semaphore:
+            return await download_asset(url, destination_dir, session)
+
     async with aiohttp.ClientSession() as session:
-        tasks = []
-        for url in urls:
-            if url:
-                tasks.append(download_asset(url, destination_dir, session))
+        tasks = [bounded_download(url) for url in urls]
 
         if tasks:
             paths = await asyncio.gather(*tasks, return_exceptions=True)
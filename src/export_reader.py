@@ -0,0 +1,92 @@
+"""
+Read access to an existing exports/ tree
+"""
+import json
+import os
+from typing import Any, Dict, Iterator, List, Tuple
+
+# Section name -> (JSON file relative to the export dir, key holding the records)
+SECTION_FILES: Dict[str, Tuple[str, str]] = {
+    "families": ("families/families.json", "families"),
+    "staff": ("staff/staff.json", "staff"),
+    "groups": ("groups/groups.json", "groups"),
+    "birthdays": ("events.json", "birthdays"),
+    "anniversaries": ("events.json", "anniversaries"),
+    "pages": ("additional_pages/additional_pages.json", "additional_pages"),
+}
+
+# Sections whose records carry a downloaded photo
+PHOTO_SECTIONS = ("families", "staff", "groups")
+
+# Directories (relative to the export dir) the downloader writes assets to
+ASSET_DIRS = ("families/photos", "staff/photos", "groups/photos", "additional_pages/assets")
+
+# Fields searched by text queries, in display order
+LABEL_FIELDS = ("name", "family", "title", "description")
+
+
+def load_export_file(base_dir: str, relative_path: str) -> Dict[str, Any]:
+    """
+    Load one export JSON file.
+
+    Args:
+        base_dir: Export directory
+        relative_path: File path relative to base_dir
+
+    Returns:
+        dict: Parsed file contents, or an empty dict if the file is missing
+    """
+    filepath = os.path.join(base_dir, relative_path)
+    if not os.path.exists(filepath):
+        return {}
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_section(base_dir: str, section: str) -> List[Dict[str, Any]]:
+    """
+    Load the records of one section.
+
+    Args:
+        base_dir: Export directory
+        section: Section name from SECTION_FILES
+
+    Returns:
+        list: Records of the section (empty if it was never exported)
+    """
+    relative_path, key = SECTION_FILES[section]
+    return load_export_file(base_dir, relative_path).get(key, [])
+
+
+def iter_sections(base_dir: str) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+    """Yield (section, records) for every known section."""
+    for section in SECTION_FILES:
+        yield section, load_section(base_dir, section)
+
+
+def resolve_asset_path(base_dir: str, path: str) -> str:
+    """
+    Resolve an asset path as stored in the export JSON.
+
+    Stored paths are relative to the directory the scraper ran in, which is
+    the parent of the export directory.
+
+    Args:
+        base_dir: Export directory
+        path: Path as stored in a record
+
+    Returns:
+        str: Filesystem path to the asset
+    """
+    if os.path.isabs(path):
+        return path
+    return os.path.join(os.path.dirname(os.path.abspath(base_dir)), path)
+
+
+def record_label(record: Dict[str, Any]) -> str:
+    """Return the most descriptive text field of a record."""
+    for field in LABEL_FIELDS:
+        value = record.get(field)
+        if value:
+            return str(value)
+    return record.get("id", "")
@@ -5,7 +5,88 @@ import json
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Union, List, Dict
+from typing import Any, Iterable, Iterator, Union, List, Dict
+
+from src.archive import get_export_archive
+from src.manifest import record_export_file
+from src.models import to_json_value
+
+# Records encoded per chunk by export_json_chunks()
+RECORD_BATCH_SIZE = 1000
+
+# No indent, so encode() runs the C encoder; records go through to_json_value
+_encoder = json.JSONEncoder(ensure_ascii=False, default=to_json_value)
+
+
+def write_export_file(filepath: str, data: bytes) -> None:
+    """
+    Write one export file, into the active archive if there is one.
+
+    Files written to the export directory are recorded in the active
+    manifest (see src.manifest).
+
+    Args:
+        filepath: Path under the export directory
+        data: File contents
+    """
+    archive = get_export_archive()
+    if archive:
+        archive.add_bytes(filepath, data)
+        return
+
+    Path(os.path.dirname(filepath) or ".").mkdir(parents=True, exist_ok=True)
+    with open(filepath, 'wb') as f:
+        f.write(data)
+    record_export_file(filepath, data)
+
+
+def write_export_chunks(filepath: str, chunks: Iterable[str]) -> None:
+    """
+    Write one export file from text chunks, into the active archive if there is one.
+
+    In the export directory the chunks are streamed to disk as they come;
+    archives need the whole file, so they get the chunks joined.
+
+    Args:
+        filepath: Path under the export directory
+        chunks: File contents as UTF-8 text
+    """
+    archive = get_export_archive()
+    if archive:
+        archive.add_bytes(filepath, b"".join(chunk.encode('utf-8') for chunk in chunks))
+        return
+
+    Path(os.path.dirname(filepath) or ".").mkdir(parents=True, exist_ok=True)
+    with open(filepath, 'w', encoding='utf-8', newline='') as f:
+        for chunk in chunks:
+            f.write(chunk)
+    record_export_file(filepath)
+
+
+def export_json_chunks(export_data: Dict[str, Any]) -> Iterator[str]:
+    """
+    Yield an export document as JSON text, a batch of records at a time.
+
+    Top-level lists are written one item per line; everything else is
+    written on the line of its key. This layout can use the C encoder,
+    which json.dumps(indent=2) cannot, and never holds the whole document
+    as one string.
+
+    Args:
+        export_data: Top-level keys and values, e.g. {"metadata": ..., "families": [...]}
+    """
+    yield "{"
+    for index, (key, value) in enumerate(export_data.items()):
+        yield ("," if index else "") + "\n  " + _encoder.encode(key) + ": "
+        if not isinstance(value, list) or not value:
+            yield _encoder.encode(value)
+            continue
+        yield "["
+        for start in range(0, len(value), RECORD_BATCH_SIZE):
+            batch = value[start:start + RECORD_BATCH_SIZE]
+            yield ("," if start else "") + "\n    " + ",\n    ".join(map(_encoder.encode, batch))
+        yield "\n  ]"
+    yield "\n}"
 
 
 async def export_to_json(
@@ -18,15 +99,14 @@ async def export_to_json(
 
     Args:
         category: Category name (families, staff, groups, etc.)
-        data: Data to export (list of records or dict)
+        data: Data to export (list of records or dict); Record objects are
+            serialized through their to_dict() hook, one record per line
         base_dir: Base export directory
 
     Returns:
         str: Path to the created JSON file
     """
-    # Create export directory
     export_dir = os.path.join(base_dir, category)
-    Path(export_dir).mkdir(parents=True, exist_ok=True)
 
     # Prepare data with metadata
     if isinstance(data, list):
@@ -53,8 +133,7 @@ async def export_to_json(
 
     # Write to file
     filepath = os.path.join(export_dir, f"{category}.json")
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(export_data, f, indent=2, ensure_ascii=False)
+    write_export_chunks(filepath, export_json_chunks(export_data))
 
     print(f"  Exported {total_records} records to {filepath}")
     return filepath
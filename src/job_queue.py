@@ -0,0 +1,190 @@
+"""
+SQLite-backed job queue shared by worker processes
+"""
+import json
+import sqlite3
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+PENDING = "pending"
+LEASED = "leased"
+DONE = "done"
+FAILED = "failed"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    worker TEXT,
+    lease_until REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    result TEXT,
+    error TEXT,
+    UNIQUE (kind, key)
+);
+CREATE INDEX IF NOT EXISTS jobs_claim ON jobs (status, kind, id);
+"""
+
+
+class Job:
+    """A claimed job."""
+
+    __slots__ = ("id", "kind", "key", "payload")
+
+    def __init__(self, id: int, kind: str, key: str, payload: Dict[str, Any]):
+        self.id = id
+        self.kind = kind
+        self.key = key
+        self.payload = payload
+
+
+class JobQueue:
+    """Job table in a SQLite file, safe to share between processes."""
+
+    def __init__(self, path: str, lease_seconds: float = 120, max_attempts: int = 3):
+        """
+        Args:
+            path: SQLite database file (created if missing)
+            lease_seconds: How long a claim lasts before the job is handed out again
+            max_attempts: Claims per job before it is marked failed
+        """
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        # Autocommit mode: transactions are opened explicitly where needed
+        self._db = sqlite3.connect(path, timeout=30, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._db.close()
+
+    def __enter__(self) -> "JobQueue":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def enqueue(self, kind: str, key: str, payload: Dict[str, Any]) -> bool:
+        """
+        Add a job unless one with the same kind and key exists.
+
+        Returns:
+            bool: True if the job was added
+        """
+        cursor = self._db.execute(
+            "INSERT OR IGNORE INTO jobs (kind, key, payload) VALUES (?, ?, ?)",
+            (kind, key, json.dumps(payload))
+        )
+        return cursor.rowcount > 0
+
+    def enqueue_many(self, kind: str, jobs: Iterable[tuple]) -> int:
+        """
+        Add (key, payload) jobs in one transaction.
+
+        Returns:
+            int: Number of jobs added
+        """
+        self._db.execute("BEGIN IMMEDIATE")
+        try:
+            added = sum(self.enqueue(kind, key, payload) for key, payload in jobs)
+            self._db.execute("COMMIT")
+        except Exception:
+            self._db.execute("ROLLBACK")
+            raise
+        return added
+
+    def claim(self, worker: str, kinds: Iterable[str], limit: int = 1) -> List[Job]:
+        """
+        Lease up to `limit` pending jobs of the given kinds.
+
+        Jobs whose lease expired are claimable again; those out of attempts
+        are marked failed instead.
+
+        Args:
+            worker: Name of the claiming worker
+            kinds: Job kinds this worker handles
+            limit: Maximum number of jobs to claim
+
+        Returns:
+            list: Claimed jobs (empty if none are available right now)
+        """
+        kinds = list(kinds)
+        marks = ",".join("?" * len(kinds))
+        now = time.time()
+
+        # BEGIN IMMEDIATE takes the write lock up front, so two workers can
+        # never select the same rows
+        self._db.execute("BEGIN IMMEDIATE")
+        try:
+            self._db.execute(
+                "UPDATE jobs SET status = ?, error = 'lease expired' "
+                "WHERE status = ? AND lease_until < ? AND attempts >= ?",
+                (FAILED, LEASED, now, self.max_attempts)
+            )
+            rows = self._db.execute(
+                f"SELECT id, kind, key, payload FROM jobs WHERE kind IN ({marks}) "
+                "AND (status = ? OR (status = ? AND lease_until < ?)) ORDER BY id LIMIT ?",
+                (*kinds, PENDING, LEASED, now, limit)
+            ).fetchall()
+            self._db.executemany(
+                "UPDATE jobs SET status = ?, worker = ?, lease_until = ?, attempts = attempts + 1 WHERE id = ?",
+                [(LEASED, worker, now + self.lease_seconds, row[0]) for row in rows]
+            )
+            self._db.execute("COMMIT")
+        except Exception:
+            self._db.execute("ROLLBACK")
+            raise
+
+        return [Job(row[0], row[1], row[2], json.loads(row[3])) for row in rows]
+
+    def complete(self, job: Job, worker: str, result: Any) -> bool:
+        """
+        Store a job's result.
+
+        Returns:
+            bool: False if the lease had expired and another worker took the job
+        """
+        cursor = self._db.execute(
+            "UPDATE jobs SET status = ?, result = ?, error = NULL WHERE id = ? AND worker = ? AND status = ?",
+            (DONE, json.dumps(result), job.id, worker, LEASED)
+        )
+        return cursor.rowcount > 0
+
+    def fail(self, job: Job, worker: str, error: str) -> None:
+        """Release a job after an error; it is retried until out of attempts."""
+        self._db.execute(
+            "UPDATE jobs SET status = CASE WHEN attempts >= ? THEN ? ELSE ? END, error = ?, lease_until = NULL "
+            "WHERE id = ? AND worker = ? AND status = ?",
+            (self.max_attempts, FAILED, PENDING, error, job.id, worker, LEASED)
+        )
+
+    def remaining(self) -> int:
+        """Return the number of jobs not yet done or failed."""
+        return self._db.execute(
+            "SELECT COUNT(*) FROM jobs WHERE status IN (?, ?)", (PENDING, LEASED)
+        ).fetchone()[0]
+
+    def counts(self) -> Dict[str, int]:
+        """Return the number of jobs per status."""
+        return dict(self._db.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall())
+
+    def results(self, kind: str) -> Dict[str, Any]:
+        """Return key -> result of every finished job of a kind."""
+        rows = self._db.execute(
+            "SELECT key, result FROM jobs WHERE kind = ? AND status = ?", (kind, DONE)
+        ).fetchall()
+        return {key: json.loads(result) for key, result in rows}
+
+    def errors(self, kind: Optional[str] = None) -> Dict[str, str]:
+        """Return key -> last error of every failed job (of a kind, if given)."""
+        query = "SELECT key, error FROM jobs WHERE status = ?"
+        params: tuple = (FAILED,)
+        if kind:
+            query += " AND kind = ?"
+            params += (kind,)
+        return dict(self._db.execute(query, params).fetchall())
@@ -0,0 +1,192 @@
+"""
+Manifest of exported files with sizes and SHA-256 hashes
+"""
+import hashlib
+import json
+import mmap
+import os
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+MANIFEST_FILENAME = "manifest.json"
+
+
+def hash_file(path: str) -> Tuple[int, str]:
+    """
+    Return the size and SHA-256 of a file, reading it through a memory map.
+
+    hashlib releases the GIL while hashing large buffers, so this scales
+    across threads.
+    """
+    size = os.path.getsize(path)
+    digest = hashlib.sha256()
+    if size:
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            digest.update(data)
+    return size, digest.hexdigest()
+
+
+class Manifest:
+    """Sizes, hashes and source URLs of the files in an export."""
+
+    def __init__(self, files: Optional[Dict[str, Dict[str, Any]]] = None, base_dir: str = "exports"):
+        """
+        Args:
+            files: Export-relative path -> {'size', 'sha256'[, 'url']}
+            base_dir: Export directory the paths are relative to
+        """
+        self.files: Dict[str, Dict[str, Any]] = files or {}
+        self.base_dir = base_dir
+
+    def relative(self, filepath: str) -> str:
+        """Map a path under the export directory to its manifest key."""
+        relative = os.path.relpath(filepath, self.base_dir)
+        if relative.startswith('..'):
+            relative = filepath
+        return relative.replace(os.sep, '/')
+
+    def add(self, path: str, data: bytes, source_url: str = "") -> None:
+        """
+        Record one file from its contents.
+
+        Args:
+            path: Path relative to the export directory (forward slashes)
+            data: File contents
+            source_url: URL the file was downloaded from, if any
+        """
+        self.add_entry(path, len(data), hashlib.sha256(data).hexdigest(), source_url)
+
+    def add_entry(self, path: str, size: int, sha256: str, source_url: str = "") -> None:
+        """Record one file from an already computed size and hash."""
+        entry: Dict[str, Any] = {"size": size, "sha256": sha256}
+        if source_url:
+            entry["url"] = source_url
+        self.files[path] = entry
+
+    def has_other_source(self, filepath: str, source_url: str) -> bool:
+        """Return True if the manifest records a file at this path downloaded from another URL."""
+        entry = self.files.get(self.relative(filepath))
+        return bool(entry and entry.get("url") and entry["url"] != source_url)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the manifest in its JSON form."""
+        return {
+            "generated": datetime.utcnow().isoformat() + "Z",
+            "total_files": len(self.files),
+            "total_bytes": sum(entry["size"] for entry in self.files.values()),
+            "files": dict(sorted(self.files.items())),
+        }
+
+    def to_json(self) -> bytes:
+        """Return the manifest as UTF-8 JSON."""
+        return json.dumps(self.to_dict(), indent=2, ensure_ascii=False).encode('utf-8')
+
+    @classmethod
+    def load(cls, path: str, base_dir: str = "exports") -> "Manifest":
+        """Load a manifest written by to_json()."""
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f).get("files", {}), base_dir)
+
+
+# Manifest of the directory export in progress, set by start_manifest()
+_export_manifest: Optional[Manifest] = None
+
+
+def get_export_manifest() -> Optional[Manifest]:
+    """Return the manifest being recorded, or None."""
+    return _export_manifest
+
+
+def start_manifest(base_dir: str = "exports") -> Manifest:
+    """
+    Start recording written files, continuing the export's existing manifest.
+
+    Args:
+        base_dir: Export directory
+
+    Returns:
+        Manifest: The active manifest
+    """
+    global _export_manifest
+
+    path = os.path.join(base_dir, MANIFEST_FILENAME)
+    if os.path.exists(path):
+        try:
+            _export_manifest = Manifest.load(path, base_dir)
+        except (OSError, ValueError) as e:
+            print(f"  Warning: Starting a new manifest, could not read {path}: {str(e)}")
+            _export_manifest = Manifest(base_dir=base_dir)
+    else:
+        _export_manifest = Manifest(base_dir=base_dir)
+    return _export_manifest
+
+
+def record_export_file(filepath: str, data: Optional[bytes] = None, source_url: str = "") -> None:
+    """
+    Record a file just written to the export directory.
+
+    Does nothing unless a manifest is being recorded.
+
+    Args:
+        filepath: Path of the written file
+        data: Its contents, if at hand (otherwise the file is hashed)
+        source_url: URL the file was downloaded from, if any
+    """
+    if _export_manifest is None:
+        return
+    key = _export_manifest.relative(filepath)
+    if data is not None:
+        _export_manifest.add(key, data, source_url)
+    else:
+        size, sha256 = hash_file(filepath)
+        _export_manifest.add_entry(key, size, sha256, source_url)
+
+
+def record_existing_file(filepath: str, source_url: str = "") -> None:
+    """
+    Record a file kept from an earlier run.
+
+    The earlier manifest entry is kept as-is when the size still matches,
+    so a file that was damaged since is reported by verification instead of
+    being re-hashed into the manifest as if it were good.
+    """
+    if _export_manifest is None:
+        return
+    entry = _export_manifest.files.get(_export_manifest.relative(filepath))
+    if entry and entry["size"] == os.path.getsize(filepath):
+        if source_url and not entry.get("url"):
+            entry["url"] = source_url
+        return
+    record_export_file(filepath, source_url=source_url)
+
+
+def save_manifest() -> Optional[str]:
+    """
+    Write the active manifest to the export directory and keep recording.
+
+    Returns:
+        str: Path of the written manifest, or None if none is active
+    """
+    if _export_manifest is None:
+        return None
+    path = os.path.join(_export_manifest.base_dir, MANIFEST_FILENAME)
+    os.makedirs(_export_manifest.base_dir, exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(_export_manifest.to_json())
+    os.replace(tmp_path, path)
+    return path
+
+
+def finish_manifest() -> Optional[str]:
+    """
+    Write the active manifest to the export directory and stop recording.
+
+    Returns:
+        str: Path of the written manifest, or None if none was active
+    """
+    global _export_manifest
+
+    path = save_manifest()
+    _export_manifest = None
+    return path
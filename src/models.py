@@ -0,0 +1,187 @@
+"""
+Slotted record types produced by the scrapers
+"""
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Optional
+
+
+class Record:
+    """Base class for exported records."""
+
+    __slots__ = ()
+
+    _values: Callable[["Record"], tuple]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Fetches every slot value in one C-level call
+        cls._values = staticmethod(attrgetter(*cls.__slots__))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the record as an export dict, in field order."""
+        return dict(zip(self.__slots__, self._values(self)))
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Record":
+        """Build a record from an export dict, ignoring unknown keys."""
+        return cls(**{key: value for key, value in data.items() if key in cls.__slots__})
+
+    def __eq__(self, other: Any) -> bool:
+        return type(self) is type(other) and self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{field}={getattr(self, field)!r}" for field in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class Member(Record):
+    """One person listed in a family."""
+
+    __slots__ = ("name", "email", "phone")
+
+    def __init__(self, name: str = "", email: str = "", phone: str = ""):
+        self.name = name
+        self.email = email
+        self.phone = phone
+
+
+class Family(Record):
+    """A family directory entry."""
+
+    __slots__ = ("id", "name", "members_text", "members", "photo", "detail_url", "contact")
+
+    def __init__(
+        self,
+        id: str = "",
+        name: str = "",
+        members_text: str = "",
+        members: Optional[List[Member]] = None,
+        photo: str = "",
+        detail_url: str = "",
+        contact: Optional[Dict[str, Any]] = None
+    ):
+        self.id = id
+        self.name = name
+        self.members_text = members_text
+        self.members = [
+            member if isinstance(member, Member) else Member.from_dict(member)
+            for member in (members or [])
+        ]
+        self.photo = photo
+        self.detail_url = detail_url
+        self.contact = contact if contact is not None else {}
+
+
+class Staff(Record):
+    """A staff directory entry."""
+
+    __slots__ = ("id", "name", "title", "email", "phone", "photo")
+
+    def __init__(
+        self,
+        id: str = "",
+        name: str = "",
+        title: str = "",
+        email: str = "",
+        phone: str = "",
+        photo: str = ""
+    ):
+        self.id = id
+        self.name = name
+        self.title = title
+        self.email = email
+        self.phone = phone
+        self.photo = photo
+
+
+class Group(Record):
+    """A group or ministry."""
+
+    __slots__ = ("id", "name", "description", "leaders", "photo")
+
+    def __init__(
+        self,
+        id: str = "",
+        name: str = "",
+        description: str = "",
+        leaders: Optional[List[str]] = None,
+        photo: str = ""
+    ):
+        self.id = id
+        self.name = name
+        self.description = description
+        self.leaders = leaders if leaders is not None else []
+        self.photo = photo
+
+
+class Event(Record):
+    """A birthday or anniversary."""
+
+    __slots__ = ("kind", "name", "date", "month_day")
+
+    # Kind -> export key holding the name
+    NAME_KEYS = {"birthday": "name", "anniversary": "family"}
+
+    def __init__(self, kind: str = "birthday", name: str = "", date: str = "", month_day: str = ""):
+        if kind not in self.NAME_KEYS:
+            raise ValueError(f"Unknown event kind: {kind}")
+        self.kind = kind
+        self.name = name
+        self.date = date
+        self.month_day = month_day
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return {'name' or 'family', 'date', 'month_day'} as exported today."""
+        return {
+            self.NAME_KEYS[self.kind]: self.name,
+            "date": self.date,
+            "month_day": self.month_day,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], kind: Optional[str] = None) -> "Event":
+        """Build an event from an export dict; the kind is inferred from its name key."""
+        if kind is None:
+            kind = "anniversary" if "family" in data else "birthday"
+        return cls(
+            kind=kind,
+            name=data.get(cls.NAME_KEYS[kind], ""),
+            date=data.get("date", ""),
+            month_day=data.get("month_day", "")
+        )
+
+
+class Page(Record):
+    """An additional page (bulletin, form, etc.)."""
+
+    __slots__ = ("id", "title", "url", "content", "assets")
+
+    def __init__(
+        self,
+        id: str = "",
+        title: str = "",
+        url: str = "",
+        content: str = "",
+        assets: Optional[List[Dict[str, str]]] = None
+    ):
+        self.id = id
+        self.title = title
+        self.url = url
+        self.content = content
+        # [{"url", "path"}] per asset; path is "" if the download failed
+        self.assets = assets if assets is not None else []
+
+
+def to_json_value(obj: Any) -> Any:
+    """
+    JSON encoder hook for records.
+
+    Pass as `default=` to json.dump. Each record is still converted with
+    to_dict() as the encoder reaches it, so this saves building the whole
+    list of dicts up front, not the per-record dicts. The hook costs about
+    as much as the encoding itself, so use it with the C encoder (no
+    indent), as src.exporter does.
+    """
+    if isinstance(obj, Record):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
@@ -0,0 +1,194 @@
+"""
+Batch normalization of scraped names, emails, phones, leaders and dates
+"""
+import re
+from typing import Dict, List, Optional, Sequence
+
+from src.calendar_index import parse_month_day
+from src.models import Event, Family, Group, Member, Staff
+
+# Country code assumed for numbers written without one (the directory is US-hosted)
+DEFAULT_COUNTRY_CODE = "1"
+
+EMAIL_PATTERN = re.compile(r'[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+# Runs of digits and phone punctuation; to_e164() decides which are numbers
+PHONE_PATTERN = re.compile(r'[+(\d][\d ().-]{6,}\d')
+# "Leader(s):" needs its colon, so prose such as "Leader training" is not a leader list
+LEADER_PATTERN = re.compile(r'\b(?:leaders?\s*:|led by\b\s*:?)\s*([^\n]+)', re.IGNORECASE)
+NAME_SEPARATOR = re.compile(r'[,;&/+]|\band\b', re.IGNORECASE)
+
+# str.translate table dropping phone punctuation
+_PHONE_PUNCTUATION = str.maketrans("", "", " ().-+")
+
+
+def to_e164(phone: str, country_code: str = DEFAULT_COUNTRY_CODE) -> str:
+    """
+    Format a phone number as E.164 ("+15551234567").
+
+    Args:
+        phone: Number as displayed, e.g. "(555) 123-4567" or "+44 20 7946 0958"
+        country_code: Country code for numbers written without one
+
+    Returns:
+        str: E.164 number, or "" if the text is not a plausible number
+    """
+    digits = phone.translate(_PHONE_PUNCTUATION)
+    if not digits.isdigit():
+        return ""
+    if phone.lstrip().startswith("+"):
+        return "+" + digits if 8 <= len(digits) <= 15 else ""
+    if len(digits) == 10:
+        return "+" + country_code + digits
+    if len(digits) == 11 and digits.startswith(country_code):
+        return "+" + digits
+    return ""
+
+
+def find_email(text: str) -> str:
+    """Return the first email address in a text, or ""."""
+    match = EMAIL_PATTERN.search(text)
+    return match.group() if match else ""
+
+
+def find_phone(text: str) -> str:
+    """Return the first phone number in a text as E.164, or ""."""
+    match = PHONE_PATTERN.search(text)
+    while match:
+        phone = to_e164(match.group())
+        if phone:
+            return phone
+        match = PHONE_PATTERN.search(text, match.end())
+    return ""
+
+
+def split_names(text: str) -> List[str]:
+    """
+    Split a list of names such as "John, Mary & Tim" into ["John", "Mary", "Tim"].
+    """
+    names = (name.strip() for name in NAME_SEPARATOR.split(text))
+    return [name for name in names if name]
+
+
+def parse_leaders(text: str) -> List[str]:
+    """Return the leader names of a group card ("Leaders: A & B", "Led by A"), or []."""
+    lowered = text.lower()
+    if 'leader' not in lowered and 'led by' not in lowered:
+        return []
+    match = LEADER_PATTERN.search(text)
+    return split_names(match.group(1)) if match else []
+
+
+def _cached(parse, values: Sequence[str]) -> List[str]:
+    # Parses each distinct value once
+    cache: Dict[str, str] = {}
+    results = []
+    for value in values:
+        result = cache.get(value)
+        if result is None:
+            result = cache[value] = parse(value)
+        results.append(result)
+    return results
+
+
+def normalize_families(families: List[Family]) -> List[Family]:
+    """
+    Fill in family members from members_text and normalize contact details.
+
+    Families that already have members keep them. Families with the same
+    members_text share their Member records, and contact lists are updated
+    in place, so the stage leaves few new objects behind for the garbage
+    collector to walk on large directories.
+
+    Args:
+        families: Family records, updated in place
+
+    Returns:
+        list: The same records
+    """
+    phones = _cached(to_e164, [phone for family in families for phone in family.contact.get("phones", ())])
+    position = 0
+    # members_text -> Member records shared by every family listing it
+    members: Dict[str, tuple] = {}
+
+    for family in families:
+        if not family.members and family.members_text:
+            shared = members.get(family.members_text)
+            if shared is None:
+                shared = members[family.members_text] = tuple(
+                    Member(name=name) for name in split_names(family.members_text)
+                )
+            family.members = list(shared)
+
+        contact = family.contact
+        if "phones" in contact:
+            count = len(contact["phones"])
+            normalized = phones[position:position + count]
+            position += count
+            contact["phones"][:] = dict.fromkeys(
+                new or old for new, old in zip(normalized, contact["phones"])
+            )
+        if "emails" in contact:
+            contact["emails"][:] = dict.fromkeys(email.strip().lower() for email in contact["emails"])
+
+    return families
+
+
+def normalize_staff(staff: List[Staff], texts: Optional[Sequence[str]] = None) -> List[Staff]:
+    """
+    Fill in staff emails and phones from their card text; phones become E.164.
+
+    Args:
+        staff: Staff records, updated in place
+        texts: Card text of each record (defaults to re-normalizing the
+            existing phone fields only)
+
+    Returns:
+        list: The same records
+    """
+    if texts is None:
+        texts = [""] * len(staff)
+
+    phones = _cached(to_e164, [member.phone for member in staff])
+    for member, text, phone in zip(staff, texts, phones):
+        if not member.email and text:
+            member.email = find_email(text)
+        if phone:
+            member.phone = phone
+        elif text and not member.phone:
+            member.phone = find_phone(text)
+
+    return staff
+
+
+def normalize_groups(groups: List[Group], texts: Sequence[str]) -> List[Group]:
+    """
+    Fill in group leaders from their card text.
+
+    Args:
+        groups: Group records, updated in place
+        texts: Card text of each record
+
+    Returns:
+        list: The same records
+    """
+    for group, text in zip(groups, texts):
+        if not group.leaders and text:
+            group.leaders = parse_leaders(text)
+    return groups
+
+
+def normalize_events(events: List[Event]) -> List[Event]:
+    """
+    Fill in month_day from each event's displayed date.
+
+    Args:
+        events: Event records, updated in place
+
+    Returns:
+        list: The same records
+    """
+    month_days = _cached(parse_month_day, [event.date for event in events])
+    for event, month_day in zip(events, month_days):
+        if not event.month_day:
+            event.month_day = month_day
+    return events
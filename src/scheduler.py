@@ -0,0 +1,258 @@
+"""
+Run-wide deadline and priority scheduling
+"""
+import asyncio
+import json
+import os
+import time
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+SECTION_STAGES = ("families", "staff", "groups", "events", "pages")
+DOWNLOAD_STAGES = ("photos", "page_assets")
+
+DEFAULT_PRIORITY = ("families", "staff", "events", "groups", "pages", "photos", "page_assets")
+
+# Relative share of the remaining time each stage is budgeted
+STAGE_WEIGHTS = {
+    "families": 3,
+    "staff": 1,
+    "groups": 1,
+    "events": 1,
+    "pages": 2,
+    "photos": 4,
+    "page_assets": 2,
+}
+
+DEFERRED_FILENAME = "deferred.json"
+
+# Seconds kept back for the search index, manifest and other final writes
+DEFAULT_RESERVE = 30.0
+
+# Shortest timeout handed to Playwright, so calls near the deadline still get a chance
+MIN_TIMEOUT_MS = 1000
+
+
+class SchedulerError(Exception):
+    """Raised when a deadline or priority order is invalid"""
+    pass
+
+
+class RunScheduler:
+    """Deadline, stage budgets and deferred work of one run."""
+
+    def __init__(
+        self,
+        deadline: float,
+        priority: Iterable[str] = DEFAULT_PRIORITY,
+        reserve: float = DEFAULT_RESERVE,
+        previously_deferred: Optional[Set[str]] = None
+    ):
+        """
+        Args:
+            deadline: Seconds the whole run may take
+            priority: Stage names, most important first; stages left out
+                run last in their default order
+            reserve: Seconds kept back at the end for final writes
+            previously_deferred: Asset URLs deferred by the last run
+
+        Raises:
+            SchedulerError: If the deadline is not positive or a stage is unknown
+        """
+        if deadline <= 0:
+            raise SchedulerError("The deadline must be positive")
+        priority = list(priority)
+        unknown = [stage for stage in priority if stage not in STAGE_WEIGHTS]
+        if unknown:
+            raise SchedulerError(f"Unknown stages: {', '.join(unknown)} (use {', '.join(DEFAULT_PRIORITY)})")
+        priority += [stage for stage in DEFAULT_PRIORITY if stage not in priority]
+
+        # Downloads need their sections scraped first, so they always run after them
+        self.stages = [stage for stage in priority if stage in SECTION_STAGES]
+        self.stages += [stage for stage in priority if stage in DOWNLOAD_STAGES]
+
+        self.deadline = deadline
+        self.started = time.monotonic()
+        self.ends_at = self.started + max(deadline - reserve, deadline / 2)
+        self.previously_deferred = previously_deferred or set()
+
+        # Stage -> {"budget", "used"} in seconds
+        self.usage: Dict[str, Dict[str, float]] = {}
+        # "sections" / "photos" / "page_assets" -> deferred items
+        self.deferred: Dict[str, List[Dict[str, Any]]] = {"sections": [], "photos": [], "page_assets": []}
+        # Download stage -> work held back until that stage runs
+        self._held: Dict[str, List[Any]] = {stage: [] for stage in DOWNLOAD_STAGES}
+        self._stage_started: Dict[str, float] = {}
+
+    def remaining(self) -> float:
+        """Return the seconds left before the deadline (less the reserve)."""
+        return max(0.0, self.ends_at - time.monotonic())
+
+    def budget(self, stage: str) -> float:
+        """Return a stage's share of the time left, weighted against the stages not yet run."""
+        position = self.stages.index(stage)
+        later = self.stages[position:]
+        total = sum(STAGE_WEIGHTS[name] for name in later)
+        return self.remaining() * STAGE_WEIGHTS[stage] / total
+
+    def section_order(self, sections: Iterable[str]) -> List[str]:
+        """Return section names in priority order."""
+        sections = list(sections)
+        return [stage for stage in self.stages if stage in sections]
+
+    def clamp_timeout(self, milliseconds: int) -> int:
+        """Return a Playwright timeout no longer than the time left."""
+        return max(MIN_TIMEOUT_MS, min(milliseconds, int(self.remaining() * 1000)))
+
+    def begin(self, stage: str) -> float:
+        """Record the start of a stage and return its budget in seconds."""
+        budget = self.budget(stage)
+        self.usage[stage] = {"budget": round(budget, 1), "used": 0.0}
+        self._stage_started[stage] = time.monotonic()
+        return budget
+
+    def end(self, stage: str) -> None:
+        """Record the end of a stage."""
+        used = time.monotonic() - self._stage_started.pop(stage)
+        self.usage[stage]["used"] = round(used, 1)
+
+    def defer(self, kind: str, item: Dict[str, Any]) -> None:
+        """Record work left for the next run ("sections", "photos" or "page_assets")."""
+        self.deferred[kind].append(item)
+
+    def hold(self, stage: str, work: Any) -> None:
+        """Keep work for a download stage until that stage runs."""
+        self._held[stage].append(work)
+
+    def held(self, stage: str) -> List[Any]:
+        """Return the work held for a download stage."""
+        return self._held[stage]
+
+    async def run_section(self, stage: str, run: Callable[[], Awaitable[Any]]) -> bool:
+        """
+        Run a section stage, bounded by the deadline.
+
+        Args:
+            stage: Section name
+            run: Starts the section's scrape and export
+
+        Returns:
+            bool: False if the section was skipped or cut off by the deadline
+        """
+        if self.remaining() <= 0:
+            print(f"\nSkipping {stage}: out of time")
+            self.defer("sections", {"section": stage, "reason": "not started"})
+            return False
+
+        budget = self.begin(stage)
+        try:
+            await asyncio.wait_for(run(), timeout=self.remaining())
+            return True
+        except asyncio.TimeoutError:
+            print(f"  Stopped {stage} at the deadline")
+            self.defer("sections", {"section": stage, "reason": "deadline"})
+            return False
+        finally:
+            self.end(stage)
+            if self.usage[stage]["used"] > budget:
+                print(f"  {stage} took {self.usage[stage]['used']:.0f}s of a {budget:.0f}s budget")
+
+    async def run_downloads(
+        self,
+        stage: str,
+        jobs: List[Callable[[], Awaitable[Any]]],
+        max_concurrency: int = 8
+    ) -> Tuple[List[Any], List[int]]:
+        """
+        Run download jobs until the stage budget is spent.
+
+        Args:
+            stage: Download stage name
+            jobs: Functions starting one download each, most urgent first
+            max_concurrency: Maximum downloads in flight
+
+        Returns:
+            tuple: (results, deferred) where results[i] is job i's result
+            (None if it failed or was cut off) and deferred lists the indexes
+            of jobs cut off by the budget
+        """
+        budget = self.begin(stage)
+        results: List[Any] = [None] * len(jobs)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(index):
+            async with semaphore:
+                results[index] = await jobs[index]()
+
+        tasks = [asyncio.ensure_future(run(index)) for index in range(len(jobs))]
+        deferred = []
+        if tasks:
+            done, pending = await asyncio.wait(tasks, timeout=budget)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            for task in done:
+                if task.exception():
+                    print(f"    Error downloading: {str(task.exception())}")
+            deferred = [index for index, task in enumerate(tasks) if task in pending]
+
+        self.end(stage)
+        return results, deferred
+
+    def urgent_first(self, urls: List[str]) -> List[str]:
+        """Order URLs so those deferred by the last run come first."""
+        return sorted(urls, key=lambda url: url not in self.previously_deferred)
+
+    def summary(self) -> List[str]:
+        """Return one line per deferred item, for the run summary."""
+        lines = [f"section {item['section']} ({item['reason']})" for item in self.deferred["sections"]]
+        for kind in DOWNLOAD_STAGES:
+            if self.deferred[kind]:
+                lines.append(f"{len(self.deferred[kind])} {kind.replace('_', ' ')}")
+        return lines
+
+    def to_json(self) -> bytes:
+        """Return the schedule and deferred work as deferred.json contents."""
+        report = {
+            "generated": datetime.utcnow().isoformat() + "Z",
+            "deadline_seconds": self.deadline,
+            "elapsed_seconds": round(time.monotonic() - self.started, 1),
+            "stages": self.usage,
+            "deferred": self.deferred,
+        }
+        return json.dumps(report, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def load_deferred_urls(base_dir: str = "exports") -> Set[str]:
+    """Return the asset URLs the previous run deferred (empty if none)."""
+    path = os.path.join(base_dir, DEFERRED_FILENAME)
+    if not os.path.exists(path):
+        return set()
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            deferred = json.load(f).get("deferred", {})
+    except (OSError, ValueError):
+        return set()
+    return {item["url"] for kind in DOWNLOAD_STAGES for item in deferred.get(kind, []) if item.get("url")}
+
+
+# Scheduler of the current run, set by start_scheduler()
+_scheduler: Optional[RunScheduler] = None
+
+
+def get_scheduler() -> Optional[RunScheduler]:
+    """Return the active scheduler, or None when the run has no deadline."""
+    return _scheduler
+
+
+def start_scheduler(deadline: float, priority: Iterable[str] = DEFAULT_PRIORITY, base_dir: str = "exports") -> RunScheduler:
+    """Give the run a deadline; the clock starts now."""
+    global _scheduler
+    _scheduler = RunScheduler(deadline, priority, previously_deferred=load_deferred_urls(base_dir))
+    return _scheduler
+
+
+def stop_scheduler() -> None:
+    """Return to running without a deadline."""
+    global _scheduler
+    _scheduler = None
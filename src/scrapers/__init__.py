@@ -1 +1,25 @@
 # Scraper modules
+
+# Extra time (ms) list pages get to finish rendering after network idle.
+# Replayed captures respond instantly, so replay mode sets this to 0.
+SETTLE_MS = 2000
+
+
+def set_settle_ms(milliseconds: int) -> None:
+    """Change the post-load settle delay for all scrapers."""
+    global SETTLE_MS
+    SETTLE_MS = milliseconds
+
+
+async def settle(page) -> None:
+    """Give a list page time to finish rendering after network idle."""
+    if SETTLE_MS:
+        await page.wait_for_timeout(SETTLE_MS)
+
+
+def timeout_ms(milliseconds: int) -> int:
+    """Clamp a Playwright timeout to the time left before the run deadline, if any."""
+    from src.scheduler import get_scheduler
+
+    scheduler = get_scheduler()
+    return scheduler.clamp_timeout(milliseconds) if scheduler else milliseconds
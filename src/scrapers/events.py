@@ -2,14 +2,61 @@
 Events scraper for birthdays and anniversaries
 """
 from playwright.async_api import Page
-from typing import Dict, Any, List
+from typing import Dict, List
+import asyncio
 import re
 
+from src.models import Event
+from src.normalize import normalize_events
+from src.scrapers import settle, timeout_ms
 
-async def scrape_events(page: Page) -> Dict[str, List[Dict[str, Any]]]:
+
+async def scrape_event_list(page: Page, url: str, label: str, kind: str) -> List[Event]:
+    """
+    Scrape one event list page (birthdays or anniversaries).
+
+    Args:
+        page: Authenticated Playwright page
+        url: Event list URL
+        label: Plural label used in progress messages
+        kind: Event kind ("birthday" or "anniversary"), also the singular label
+
+    Returns:
+        List of events
+    """
+    print(f"  Navigating to {label} page...")
+    await page.goto(url, timeout=timeout_ms(15000))
+    await page.wait_for_load_state('networkidle', timeout=timeout_ms(10000))
+    await settle(page)
+
+    elements = await page.query_selector_all('.js-icd-members-family-list-item')
+    print(f"  Found {len(elements)} {kind} entries")
+
+    records = []
+    for element in elements:
+        try:
+            text = await element.inner_text()
+            lines = [line.strip() for line in text.split('\n') if line.strip()]
+
+            if lines:
+                date = lines[1] if len(lines) > 1 else ""
+
+                records.append(Event(kind=kind, name=lines[0], date=date))
+        except Exception as e:
+            print(f"    Warning: Error processing {kind}: {str(e)}")
+            continue
+
+    # month_day is filled in for the whole list at once
+    return normalize_events(records)
+
+
+async def scrape_events(page: Page) -> Dict[str, List[Event]]:
     """
     Scrape birthdays and anniversaries.
 
+    Both lists are loaded concurrently, anniversaries in a second tab of
+    the same authenticated browser context.
+
     Args:
         page: Authenticated Playwright page
 
@@ -23,6 +70,7 @@ async def scrape_events(page: Page) -> Dict[str, List[Dict[str, Any]]]:
         "anniversaries": []
     }
 
+    second_page = None
     try:
         # Extract directory ID from current URL
         current_url = page.url
@@ -32,62 +80,21 @@ async def scrape_events(page: Page) -> Dict[str, List[Dict[str, Any]]]:
             return events
 
         directory_id = match.group(1)
-
-        # Scrape birthdays
-        print("  Navigating to birthdays page...")
         birthdays_url = f'https://members.instantchurchdirectory.com/birthdays/{directory_id}'
-        await page.goto(birthdays_url, timeout=15000)
-        await page.wait_for_load_state('networkidle', timeout=10000)
-        await page.wait_for_timeout(2000)
-
-        # Get all birthday items
-        birthday_elements = await page.query_selector_all('.js-icd-members-family-list-item')
-        print(f"  Found {len(birthday_elements)} birthday entries")
-
-        for element in birthday_elements:
-            try:
-                text = await element.inner_text()
-                lines = [line.strip() for line in text.split('\n') if line.strip()]
-
-                if lines:
-                    name = lines[0]
-                    date = lines[1] if len(lines) > 1 else ""
-
-                    events["birthdays"].append({
-                        "name": name,
-                        "date": date
-                    })
-            except Exception as e:
-                print(f"    Warning: Error processing birthday: {str(e)}")
-                continue
-
-        # Scrape anniversaries
-        print("  Navigating to anniversaries page...")
         anniversaries_url = f'https://members.instantchurchdirectory.com/anniversaries/{directory_id}'
-        await page.goto(anniversaries_url, timeout=15000)
-        await page.wait_for_load_state('networkidle', timeout=10000)
-        await page.wait_for_timeout(2000)
-
-        # Get all anniversary items
-        anniversary_elements = await page.query_selector_all('.js-icd-members-family-list-item')
-        print(f"  Found {len(anniversary_elements)} anniversary entries")
-
-        for element in anniversary_elements:
-            try:
-                text = await element.inner_text()
-                lines = [line.strip() for line in text.split('\n') if line.strip()]
-
-                if lines:
-                    family = lines[0]
-                    date = lines[1] if len(lines) > 1 else ""
-
-                    events["anniversaries"].append({
-                        "family": family,
-                        "date": date
-                    })
-            except Exception as e:
-                print(f"    Warning: Error processing anniversary: {str(e)}")
-                continue
+
+        second_page = await page.context.new_page()
+        results = await asyncio.gather(
+            scrape_event_list(page, birthdays_url, "birthdays", "birthday"),
+            scrape_event_list(second_page, anniversaries_url, "anniversaries", "anniversary"),
+            return_exceptions=True
+        )
+        # A failed list is left empty; the other one is kept
+        for key, result in zip(("birthdays", "anniversaries"), results):
+            if isinstance(result, Exception):
+                print(f"  Error scraping {key}: {str(result)}")
+            else:
+                events[key] = result
 
         print(f"  Total: {len(events['birthdays'])} birthdays and {len(events['anniversaries'])} anniversaries")
 
@@ -95,5 +102,8 @@ async def scrape_events(page: Page) -> Dict[str, List[Dict[str, Any]]]:
         print(f"  Error scraping events: {str(e)}")
         import traceback
         traceback.print_exc()
+    finally:
+        if second_page:
+            await second_page.close()
 
     return events
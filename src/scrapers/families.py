@@ -2,11 +2,47 @@
 Families scraper for Instant Church Directory
 """
 from playwright.async_api import Page
-from typing import List, Dict, Any
+from typing import List
 import re
 
+from src.models import Family
+from src.normalize import normalize_families
+from src.scrapers import settle, timeout_ms
+
+# Email addresses, phone numbers and text of a family detail page
+FAMILY_DETAIL_JS = """
+() => {
+    const root = document.querySelector('main, [role="main"], .content') || document.body;
+    const links = prefix => Array.from(
+        root.querySelectorAll(`a[href^="${prefix}"]`),
+        a => decodeURIComponent(a.getAttribute('href').slice(prefix.length)).split('?')[0].trim()
+    ).filter(Boolean);
+    return {emails: links('mailto:'), phones: links('tel:'), details: root.innerText.trim()};
+}
+"""
+
+
+async def scrape_family_detail(page: Page, detail_url: str) -> dict:
+    """
+    Visit one family detail page and collect its contact information.
+
+    Args:
+        page: Authenticated Playwright page to load it in
+        detail_url: The family's detail page URL
+
+    Returns:
+        dict: Contact info with 'emails', 'phones' and the page text as 'details'
+    """
+    await page.goto(detail_url, timeout=timeout_ms(15000))
+    await page.wait_for_load_state('networkidle', timeout=timeout_ms(10000))
+
+    contact = await page.evaluate(FAMILY_DETAIL_JS)
+    contact["emails"] = list(dict.fromkeys(contact["emails"]))
+    contact["phones"] = list(dict.fromkeys(contact["phones"]))
+    return contact
+
 
-async def scrape_families(page: Page) -> List[Dict[str, Any]]:
+async def scrape_families(page: Page) -> List[Family]:
     """
     Scrape family directory information.
 
@@ -29,13 +65,13 @@ async def scrape_families(page: Page) -> List[Dict[str, Any]]:
             match = re.search(r'/([a-f0-9-]{36})', current_url)
             if match:
                 directory_id = match.group(1)
-                await page.goto(f'https://members.instantchurchdirectory.com/families/{directory_id}', timeout=15000)
+                await page.goto(f'https://members.instantchurchdirectory.com/families/{directory_id}', timeout=timeout_ms(15000))
             else:
                 print("  Warning: Could not determine directory ID")
                 return families
 
-        await page.wait_for_load_state('networkidle', timeout=10000)
-        await page.wait_for_timeout(2000)
+        await page.wait_for_load_state('networkidle', timeout=timeout_ms(10000))
+        await settle(page)
 
         # Find family list items using the correct selector
         family_elements = await page.query_selector_all('.js-icd-members-family-list-item')
@@ -75,18 +111,16 @@ async def scrape_families(page: Page) -> List[Dict[str, Any]]:
                         else:
                             photo_url = src
 
-                family_data = {
-                    "id": f"family_{str(idx + 1).zfill(3)}",
-                    "name": family_name,
-                    "members_text": members_text,
-                    "photo": photo_url,
-                    "detail_url": detail_url,
-                    "contact": {}
-                }
+                family_data = Family(
+                    id=f"family_{str(idx + 1).zfill(3)}",
+                    name=family_name,
+                    members_text=members_text,
+                    photo=photo_url,
+                    detail_url=detail_url
+                )
 
-                # If we have a detail URL, we could navigate there to get more info
-                # But for performance, we'll just collect the basic info for now
-                # The detail page would have full contact info, addresses, etc.
+                # Detail pages (full contact info) are only visited in
+                # sharded mode, see scrape_family_detail and src.sharding
 
                 families.append(family_data)
 
@@ -94,6 +128,7 @@ async def scrape_families(page: Page) -> List[Dict[str, Any]]:
                 print(f"  Warning: Error processing family element {idx}: {str(e)}")
                 continue
 
+        normalize_families(families)
         print(f"  Successfully scraped {len(families)} families")
 
     except Exception as e:
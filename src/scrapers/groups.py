@@ -2,11 +2,15 @@
 Groups scraper for Instant Church Directory
 """
 from playwright.async_api import Page
-from typing import List, Dict, Any
+from typing import List
 import re
 
+from src.models import Group
+from src.normalize import normalize_groups
+from src.scrapers import settle, timeout_ms
 
-async def scrape_groups(page: Page) -> List[Dict[str, Any]]:
+
+async def scrape_groups(page: Page) -> List[Group]:
     """
     Scrape groups/ministries information.
 
@@ -19,6 +23,7 @@ async def scrape_groups(page: Page) -> List[Dict[str, Any]]:
     print("\nScraping groups...")
 
     groups = []
+    texts = []
 
     try:
         # Extract directory ID from current URL
@@ -32,9 +37,9 @@ async def scrape_groups(page: Page) -> List[Dict[str, Any]]:
         groups_url = f'https://members.instantchurchdirectory.com/group/{directory_id}'
 
         print(f"  Navigating to {groups_url}")
-        await page.goto(groups_url, timeout=15000)
-        await page.wait_for_load_state('networkidle', timeout=10000)
-        await page.wait_for_timeout(2000)
+        await page.goto(groups_url, timeout=timeout_ms(15000))
+        await page.wait_for_load_state('networkidle', timeout=timeout_ms(10000))
+        await settle(page)
 
         # Find group list items
         group_elements = await page.query_selector_all('.js-icd-members-family-list-item')
@@ -63,27 +68,22 @@ async def scrape_groups(page: Page) -> List[Dict[str, Any]]:
                         else:
                             photo_url = src
 
-                # Look for leaders in text
-                leaders = []
-                if 'leader' in text_content.lower() or 'led by' in text_content.lower():
-                    leader_match = re.search(r'(?:Leader|Led by):\s*([^\n]+)', text_content, re.IGNORECASE)
-                    if leader_match:
-                        leaders = [l.strip() for l in leader_match.group(1).split(',')]
-
-                group_data = {
-                    "id": f"group_{str(idx + 1).zfill(3)}",
-                    "name": group_name,
-                    "description": description,
-                    "leaders": leaders,
-                    "photo": photo_url
-                }
+                group_data = Group(
+                    id=f"group_{str(idx + 1).zfill(3)}",
+                    name=group_name,
+                    description=description,
+                    photo=photo_url
+                )
 
                 groups.append(group_data)
+                # Leaders are parsed from this in one batch below
+                texts.append(text_content)
 
             except Exception as e:
                 print(f"  Warning: Error processing group element {idx}: {str(e)}")
                 continue
 
+        normalize_groups(groups, texts)
         print(f"  Successfully scraped {len(groups)} groups")
 
     except Exception as e:
@@ -2,14 +2,99 @@
 Additional pages scraper
 """
 from playwright.async_api import Page
-from typing import List, Dict, Any
+from typing import List
+import asyncio
 import re
 
+from src.models import Page as PageRecord
+from src.scrapers import settle, timeout_ms
 
-async def scrape_pages(page: Page) -> List[Dict[str, Any]]:
+# Linked files worth keeping with a page
+ASSET_EXTENSIONS = ('.pdf', '.jpg', '.jpeg', '.png', '.gif', '.webp', '.bmp', '.tif', '.tiff')
+
+# Page content containers, most specific first
+CONTENT_SELECTORS = ('main', '[role="main"]', '.content', 'body')
+
+# Resolved (absolute) URLs of everything a page links to or embeds
+COLLECT_LINKS_JS = """
+() => Array.from(
+    document.querySelectorAll('a[href], img[src], embed[src], iframe[src], object[data]'),
+    el => el.href || el.src || el.data || ''
+)
+"""
+
+
+def is_asset_url(url: str) -> bool:
+    """Return True for links to PDFs and images."""
+    path = url.split('#', 1)[0].split('?', 1)[0].lower()
+    return url.startswith(('http://', 'https://')) and path.endswith(ASSET_EXTENSIONS)
+
+
+async def scrape_page_detail(page: Page, page_data: PageRecord) -> None:
+    """
+    Visit one additional page and fill in its full content and assets.
+
+    Args:
+        page: Authenticated Playwright page to load it in
+        page_data: Page record to update in place
+    """
+    await page.goto(page_data.url, timeout=timeout_ms(15000))
+    await page.wait_for_load_state('networkidle', timeout=timeout_ms(10000))
+    await settle(page)
+
+    # A selector list matches in document order, where <body> always comes first
+    for selector in CONTENT_SELECTORS:
+        content_elem = await page.query_selector(selector)
+        if content_elem:
+            page_data.content = (await content_elem.inner_text()).strip()
+            break
+
+    links = await page.evaluate(COLLECT_LINKS_JS)
+    # Paths are filled in once the assets are downloaded
+    page_data.assets = [
+        {"url": url, "path": ""} for url in dict.fromkeys(url for url in links if is_asset_url(url))
+    ]
+
+
+async def scrape_page_details(page: Page, pages: List[PageRecord], pool_size: int = 4) -> None:
+    """
+    Visit additional pages concurrently through a pool of browser tabs.
+
+    Args:
+        page: Authenticated Playwright page (its context provides the pool)
+        pages: Page records to update in place
+        pool_size: Number of tabs loading pages at once
+    """
+    queue = asyncio.Queue()
+    for page_data in pages:
+        if page_data.url:
+            queue.put_nowait(page_data)
+    if queue.empty():
+        return
+
+    async def worker(tab):
+        while not queue.empty():
+            page_data = queue.get_nowait()
+            try:
+                await scrape_page_detail(tab, page_data)
+            except Exception as e:
+                print(f"  Warning: Error loading page {page_data.title}: {str(e)}")
+
+    tabs = [await page.context.new_page() for _ in range(min(pool_size, queue.qsize()))]
+    try:
+        await asyncio.gather(*(worker(tab) for tab in tabs))
+    finally:
+        for tab in tabs:
+            await tab.close()
+
+
+async def scrape_pages(page: Page) -> List[PageRecord]:
     """
     Scrape additional pages like bulletins, forms, etc.
 
+    Every listed page is then visited (concurrently) for its full content
+    and the PDFs and images it links to.
+
     Args:
         page: Authenticated Playwright page
 
@@ -32,9 +117,9 @@ async def scrape_pages(page: Page) -> List[Dict[str, Any]]:
         pages_url = f'https://members.instantchurchdirectory.com/additionalpages/{directory_id}'
 
         print(f"  Navigating to {pages_url}")
-        await page.goto(pages_url, timeout=15000)
-        await page.wait_for_load_state('networkidle', timeout=10000)
-        await page.wait_for_timeout(2000)
+        await page.goto(pages_url, timeout=timeout_ms(15000))
+        await page.wait_for_load_state('networkidle', timeout=timeout_ms(10000))
+        await settle(page)
 
         # Find additional page items
         page_elements = await page.query_selector_all('.js-icd-members-family-list-item, a[href*="additionalpage"]')
@@ -54,18 +139,21 @@ async def scrape_pages(page: Page) -> List[Dict[str, Any]]:
                 page_url = ""
                 if link_elem:
                     href = await link_elem.get_attribute('href')
-                    if href:
-                        if href.startswith('/'):
-                            page_url = 'https://members.instantchurchdirectory.com' + href
-                        else:
-                            page_url = href
-
-                page_data = {
-                    "id": f"page_{str(idx + 1).zfill(3)}",
-                    "title": page_title,
-                    "url": page_url,
-                    "content": text[:500]  # Limit content
-                }
+                else:
+                    # The list item may itself be the link
+                    href = await element.get_attribute('href')
+                if href:
+                    if href.startswith('/'):
+                        page_url = 'https://members.instantchurchdirectory.com' + href
+                    else:
+                        page_url = href
+
+                page_data = PageRecord(
+                    id=f"page_{str(idx + 1).zfill(3)}",
+                    title=page_title,
+                    url=page_url,
+                    content=text.strip()
+                )
 
                 pages.append(page_data)
 
@@ -73,7 +161,10 @@ async def scrape_pages(page: Page) -> List[Dict[str, Any]]:
                 print(f"  Warning: Error processing page element {idx}: {str(e)}")
                 continue
 
-        print(f"  Successfully scraped {len(pages)} additional pages")
+        await scrape_page_details(page, pages)
+        asset_count = sum(len(page_data.assets) for page_data in pages)
+
+        print(f"  Successfully scraped {len(pages)} additional pages with {asset_count} assets")
 
     except Exception as e:
         print(f"  Error scraping pages: {str(e)}")
@@ -2,11 +2,15 @@
 Staff scraper for Instant Church Directory
 """
 from playwright.async_api import Page
-from typing import List, Dict, Any
+from typing import List
 import re
 
+from src.models import Staff
+from src.normalize import normalize_staff
+from src.scrapers import settle, timeout_ms
 
-async def scrape_staff(page: Page) -> List[Dict[str, Any]]:
+
+async def scrape_staff(page: Page) -> List[Staff]:
     """
     Scrape staff directory information.
 
@@ -19,6 +23,7 @@ async def scrape_staff(page: Page) -> List[Dict[str, Any]]:
     print("\nScraping staff...")
 
     staff = []
+    texts = []
 
     try:
         # Extract directory ID from current URL
@@ -32,9 +37,9 @@ async def scrape_staff(page: Page) -> List[Dict[str, Any]]:
         staff_url = f'https://members.instantchurchdirectory.com/staff/{directory_id}'
 
         print(f"  Navigating to {staff_url}")
-        await page.goto(staff_url, timeout=15000)
-        await page.wait_for_load_state('networkidle', timeout=10000)
-        await page.wait_for_timeout(2000)
+        await page.goto(staff_url, timeout=timeout_ms(15000))
+        await page.wait_for_load_state('networkidle', timeout=timeout_ms(10000))
+        await settle(page)
 
         # Find staff list items (likely uses same selector as families)
         staff_elements = await page.query_selector_all('.js-icd-members-family-list-item')
@@ -63,32 +68,22 @@ async def scrape_staff(page: Page) -> List[Dict[str, Any]]:
                         else:
                             photo_url = src
 
-                # Extract contact info from text
-                email = ""
-                phone = ""
-                email_match = re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text_content)
-                if email_match:
-                    email = email_match.group()
-
-                phone_match = re.search(r'\b(?:\+?1[-.]?)?\(?([0-9]{3})\)?[-.]?([0-9]{3})[-.]?([0-9]{4})\b', text_content)
-                if phone_match:
-                    phone = phone_match.group()
-
-                staff_data = {
-                    "id": f"staff_{str(idx + 1).zfill(3)}",
-                    "name": staff_name,
-                    "title": title,
-                    "email": email,
-                    "phone": phone,
-                    "photo": photo_url
-                }
+                staff_data = Staff(
+                    id=f"staff_{str(idx + 1).zfill(3)}",
+                    name=staff_name,
+                    title=title,
+                    photo=photo_url
+                )
 
                 staff.append(staff_data)
+                # Email and phone are parsed from this in one batch below
+                texts.append(text_content)
 
             except Exception as e:
                 print(f"  Warning: Error processing staff element {idx}: {str(e)}")
                 continue
 
+        normalize_staff(staff, texts)
         print(f"  Successfully scraped {len(staff)} staff members")
 
     except Exception as e:
@@ -0,0 +1,293 @@
+"""
+Prebuilt prefix search index over names in an export
+"""
+import mmap
+import os
+import re
+import struct
+import unicodedata
+from array import array
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from src.export_reader import load_section, record_label
+from src.manifest import record_export_file
+
+# File layout (little-endian): header (magic, version, doc and term counts,
+# section offsets), docs (blob offset, length of "section\tid\tlabel"),
+# terms sorted by bytes (blob offset, length, postings offset, count), the
+# UTF-8 blob, and u32 postings ascending within each term
+MAGIC = b"ICDS"
+VERSION = 1
+HEADER = struct.Struct("<4sIIIIIII")
+DOC_ENTRY = struct.Struct("<II")
+TERM_ENTRY = struct.Struct("<IIII")
+
+INDEX_FILENAME = "search_index.bin"
+
+# Section -> record fields whose words are indexed
+INDEXED_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "families": ("name", "members_text", "members"),
+    "staff": ("name", "title"),
+    "groups": ("name", "leaders"),
+}
+
+_TOKEN = re.compile(r"\w+")
+
+
+class SearchIndexError(Exception):
+    """Raised when an index file is missing or malformed"""
+    pass
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lower-cased, accent-folded word tokens."""
+    folded = unicodedata.normalize("NFKD", text.lower())
+    folded = "".join(ch for ch in folded if not unicodedata.combining(ch))
+    return _TOKEN.findall(folded)
+
+
+def _field_text(value: Any) -> str:
+    """Flatten a record field (string, list of strings or member records) to text."""
+    if isinstance(value, list):
+        return " ".join(_field_text(item) for item in value)
+    if isinstance(value, dict):
+        return str(value.get("name", ""))
+    return str(value or "")
+
+
+def encode_search_index(load: Callable[[str], List[Dict[str, Any]]]) -> bytes:
+    """
+    Build a search index in memory.
+
+    Args:
+        load: Returns the records of a section by name, e.g. a bound
+            export_reader.load_section or ExportArchive.load_section
+
+    Returns:
+        bytes: Index file contents
+    """
+    docs: List[bytes] = []
+    postings: Dict[bytes, List[int]] = {}
+    for section, fields in INDEXED_FIELDS.items():
+        for record in load(section):
+            doc_number = len(docs)
+            label = record_label(record).replace("\t", " ").replace("\n", " ")
+            docs.append(f"{section}\t{record.get('id', '')}\t{label}".encode("utf-8"))
+
+            terms = set()
+            for field in fields:
+                terms.update(tokenize(_field_text(record.get(field))))
+            for term in terms:
+                postings.setdefault(term.encode("utf-8"), []).append(doc_number)
+
+    terms = sorted(postings)
+
+    blob = bytearray()
+    doc_table = bytearray()
+    for doc in docs:
+        doc_table += DOC_ENTRY.pack(len(blob), len(doc))
+        blob += doc
+
+    term_table = bytearray()
+    posting_data = array("I")
+    for term in terms:
+        term_table += TERM_ENTRY.pack(len(blob), len(term), len(posting_data), len(postings[term]))
+        blob += term
+        posting_data.extend(postings[term])
+    if posting_data.itemsize != 4:
+        raise SearchIndexError("Platform has no 32-bit unsigned array type")
+
+    doc_table_offset = HEADER.size
+    term_table_offset = doc_table_offset + len(doc_table)
+    blob_offset = term_table_offset + len(term_table)
+    postings_offset = blob_offset + len(blob)
+    # Align postings so they can be viewed as u32 directly from the map
+    padding = (-postings_offset) % 4
+    postings_offset += padding
+
+    if struct.pack("=I", 1) != struct.pack("<I", 1):
+        posting_data.byteswap()
+
+    return b"".join([
+        HEADER.pack(
+            MAGIC, VERSION, len(docs), len(terms),
+            doc_table_offset, term_table_offset, blob_offset, postings_offset
+        ),
+        doc_table,
+        term_table,
+        blob,
+        b"\0" * padding,
+        posting_data.tobytes(),
+    ])
+
+
+def describe_search_index(data: bytes) -> str:
+    """Return "N records (M terms)" for index file contents."""
+    _, _, doc_count, term_count = HEADER.unpack_from(data, 0)[:4]
+    return f"{doc_count} records ({term_count} terms)"
+
+
+def build_search_index(base_dir: str = "exports", output_path: Optional[str] = None, archive=None) -> str:
+    """
+    Build the search index for an export directory.
+
+    Args:
+        base_dir: Export directory to index
+        output_path: Index file path (defaults to base_dir/search_index.bin)
+        archive: Active ExportArchive to read the export from and add the
+            index to, instead of the export directory
+
+    Returns:
+        str: Path to the written index file
+    """
+    output_path = output_path or os.path.join(base_dir, INDEX_FILENAME)
+
+    if archive:
+        data = encode_search_index(archive.load_section)
+        archive.add_bytes(output_path, data)
+        print(f"  Indexed {describe_search_index(data)} into {archive.path}")
+        return output_path
+
+    data = encode_search_index(lambda section: load_section(base_dir, section))
+
+    tmp_path = output_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, output_path)
+    record_export_file(output_path, data)
+
+    print(f"  Indexed {describe_search_index(data)} to {output_path}")
+    return output_path
+
+
+class SearchIndex:
+    """Read-only view over a search index file."""
+
+    def __init__(self, path: str, use_mmap: bool = True):
+        """
+        Args:
+            path: Index file path
+            use_mmap: Memory-map the file instead of reading it into memory
+        """
+        if not os.path.exists(path):
+            raise SearchIndexError(f"Search index not found: {path}")
+
+        self._view: Optional[memoryview] = None
+        self._posting_view: Optional[memoryview] = None
+        self._file = open(path, "rb")
+        if use_mmap and os.path.getsize(path) > 0:
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            self._data = self._file.read()
+
+        if len(self._data) < HEADER.size:
+            self.close()
+            raise SearchIndexError(f"Not a search index: {path}")
+        (magic, version, self.doc_count, self.term_count, self._doc_table,
+         self._term_table, self._blob, self._postings_start) = HEADER.unpack_from(self._data, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise SearchIndexError(f"Unsupported search index format: {path}")
+
+        # Zero-copy u32 view of the postings on little-endian hosts
+        if struct.pack("=I", 1) == struct.pack("<I", 1) and (len(self._data) - self._postings_start) % 4 == 0:
+            self._view = memoryview(self._data)
+            self._posting_view = self._view[self._postings_start:].cast("I")
+
+    def close(self) -> None:
+        """Release the mapping and the file handle."""
+        for view in (self._posting_view, self._view):
+            if view is not None:
+                view.release()
+        self._posting_view = self._view = None
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _term(self, number: int) -> Tuple[bytes, int, int]:
+        blob_offset, length, postings_offset, count = TERM_ENTRY.unpack_from(
+            self._data, self._term_table + number * TERM_ENTRY.size
+        )
+        start = self._blob + blob_offset
+        return self._data[start:start + length], postings_offset, count
+
+    def _postings(self, offset: int, count: int) -> Iterable[int]:
+        if self._posting_view is not None:
+            return self._posting_view[offset:offset + count]
+        start = self._postings_start + offset * 4
+        return struct.unpack_from(f"<{count}I", self._data, start)
+
+    def _lower_bound(self, prefix: bytes) -> int:
+        low, high = 0, self.term_count
+        while low < high:
+            middle = (low + high) // 2
+            if self._term(middle)[0] < prefix:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def prefix_docs(self, prefix: str) -> Set[int]:
+        """Return the doc numbers of every term starting with `prefix`."""
+        key = prefix.encode("utf-8")
+        docs: Set[int] = set()
+        number = self._lower_bound(key)
+        while number < self.term_count:
+            term, offset, count = self._term(number)
+            if not term.startswith(key):
+                break
+            docs.update(self._postings(offset, count))
+            number += 1
+        return docs
+
+    def doc(self, number: int) -> Dict[str, str]:
+        """Return {'section', 'id', 'label'} for a doc number."""
+        blob_offset, length = DOC_ENTRY.unpack_from(self._data, self._doc_table + number * DOC_ENTRY.size)
+        start = self._blob + blob_offset
+        section, record_id, label = bytes(self._data[start:start + length]).decode("utf-8").split("\t", 2)
+        return {"section": section, "id": record_id, "label": label}
+
+    def search(self, query: str, limit: int = 20, section: Optional[str] = None) -> List[Dict[str, str]]:
+        """
+        Find records matching every word of `query` as a prefix.
+
+        Args:
+            query: Free text, e.g. "smi jo" for Smith family members named John
+            limit: Maximum number of results (0 for no limit)
+            section: Only return records from this section
+
+        Returns:
+            list: Matching docs in export order
+        """
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+
+        matches: Optional[Set[int]] = None
+        # Longest tokens first: they usually have the smallest posting sets
+        for token in sorted(tokens, key=len, reverse=True):
+            docs = self.prefix_docs(token)
+            matches = docs if matches is None else matches & docs
+            if not matches:
+                return []
+
+        results = []
+        for number in sorted(matches):
+            doc = self.doc(number)
+            if section and doc["section"] != section:
+                continue
+            results.append(doc)
+            if limit and len(results) >= limit:
+                break
+        return results
+
+
+def open_search_index(base_dir: str = "exports", use_mmap: bool = True) -> SearchIndex:
+    """Open the search index of an export directory."""
+    return SearchIndex(os.path.join(base_dir, INDEX_FILENAME), use_mmap=use_mmap)
@@ -0,0 +1,169 @@
+"""
+Sharded family crawl across worker processes sharing a SQLite job queue
+"""
+import asyncio
+import os
+import socket
+import sys
+from typing import Any, Dict, List, Optional
+
+from src.job_queue import JobQueue
+
+QUEUE_FILENAME = "queue.sqlite"
+
+# Job kinds
+FAMILY_DETAIL = "family_detail"
+ASSET = "asset"
+
+# Asset jobs a worker claims and downloads at once
+ASSET_BATCH = 8
+
+# Seconds an idle worker waits for other workers' leases to finish or expire
+IDLE_POLL = 2.0
+
+
+def enqueue_family_jobs(queue: JobQueue, families: List[Any], photo_dir: str) -> int:
+    """
+    Enqueue a detail-page job and a photo job for every family.
+
+    Args:
+        queue: Job queue
+        families: Family records from the list page
+        photo_dir: Directory photos are downloaded to
+
+    Returns:
+        int: Number of jobs added (jobs already queued are not counted)
+    """
+    details = [(family.detail_url, {"url": family.detail_url}) for family in families if family.detail_url]
+    photos = [(family.photo, {"url": family.photo, "dest": photo_dir}) for family in families if family.photo]
+    return queue.enqueue_many(FAMILY_DETAIL, details) + queue.enqueue_many(ASSET, photos)
+
+
+def merge_family_results(queue: JobQueue, families: List[Any]) -> Dict[str, int]:
+    """
+    Apply finished detail and photo jobs to the family records.
+
+    Families whose jobs failed keep their list-page data (and photo URL),
+    as in an unsharded run.
+
+    Args:
+        queue: Drained job queue
+        families: Family records to update in place
+
+    Returns:
+        dict: Counts of merged 'details' and 'photos'
+    """
+    from src.manifest import record_existing_file
+    from src.normalize import normalize_families
+
+    details = queue.results(FAMILY_DETAIL)
+    photos = queue.results(ASSET)
+    merged = {"details": 0, "photos": 0}
+
+    for family in families:
+        contact = details.get(family.detail_url)
+        if contact is not None:
+            family.contact = contact
+            merged["details"] += 1
+        path = photos.get(family.photo, {}).get("path") if family.photo else None
+        if path and os.path.exists(path):
+            # Downloaded by another process: add it to this run's manifest
+            record_existing_file(path, family.photo)
+            family.photo = path
+            merged["photos"] += 1
+
+    # Detail-page phones and emails go through the same normalization as list data
+    normalize_families(families)
+    return merged
+
+
+async def spawn_workers(script: str, queue_path: str, count: int) -> List[asyncio.subprocess.Process]:
+    """
+    Start worker processes running `script --worker queue_path`.
+
+    Args:
+        script: Path of scraper.py
+        queue_path: Job queue file
+        count: Number of workers
+
+    Returns:
+        list: The started processes
+    """
+    return [
+        await asyncio.create_subprocess_exec(sys.executable, script, "--worker", queue_path)
+        for _ in range(count)
+    ]
+
+
+async def _run_asset_jobs(queue: JobQueue, worker: str, jobs: List[Any]) -> int:
+    # Downloads a batch of photo jobs; returns how many succeeded
+    import aiohttp
+
+    from src.downloader import download_asset
+
+    async with aiohttp.ClientSession() as session:
+        paths = await asyncio.gather(
+            *(download_asset(job.payload["url"], job.payload["dest"], session) for job in jobs),
+            return_exceptions=True
+        )
+    completed = 0
+    for job, path in zip(jobs, paths):
+        if isinstance(path, str) and path:
+            completed += queue.complete(job, worker, {"path": path})
+        else:
+            queue.fail(job, worker, str(path) if isinstance(path, Exception) else "download failed")
+    return completed
+
+
+async def run_worker(queue_path: str, name: Optional[str] = None) -> Dict[str, int]:
+    """
+    Log in and process family detail and photo jobs until the queue is drained.
+
+    Args:
+        queue_path: Job queue file
+        name: Worker name recorded on its leases (default: host-pid)
+
+    Returns:
+        dict: Number of jobs completed per kind
+    """
+    from src.auth import get_authenticated_page
+    from src.downloader import BROWSER, HTTP, get_backend_counts, set_browser_context
+    from src.scrapers.families import scrape_family_detail
+
+    name = name or f"{socket.gethostname()}-{os.getpid()}"
+    done = {FAMILY_DETAIL: 0, ASSET: 0}
+    page, browser = await get_authenticated_page()
+    set_browser_context(page.context)
+
+    try:
+        with JobQueue(queue_path) as queue:
+            while True:
+                # Detail pages need this worker's browser; photos only its bandwidth
+                jobs = queue.claim(name, [FAMILY_DETAIL]) or queue.claim(name, [ASSET], ASSET_BATCH)
+                if not jobs:
+                    if not queue.remaining():
+                        break
+                    await asyncio.sleep(IDLE_POLL)
+                    continue
+
+                if jobs[0].kind == ASSET:
+                    done[ASSET] += await _run_asset_jobs(queue, name, jobs)
+                    continue
+
+                job = jobs[0]
+                try:
+                    contact = await scrape_family_detail(page, job.payload["url"])
+                    queue.complete(job, name, contact)
+                    done[FAMILY_DETAIL] += 1
+                except Exception as e:
+                    print(f"  [{name}] Warning: Error loading {job.key}: {str(e)}")
+                    queue.fail(job, name, str(e))
+    finally:
+        set_browser_context(None)
+        await page.context.close()
+        await browser.close()
+
+    downloads = get_backend_counts()
+    print(f"  [{name}] Finished {done[FAMILY_DETAIL]} detail pages and {done[ASSET]} photos "
+          f"({downloads[HTTP]} over HTTP, {downloads[BROWSER]} through the browser session)")
+    return done
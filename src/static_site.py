@@ -0,0 +1,278 @@
+"""
+Incremental static browse site generator for an exports/ tree
+"""
+import hashlib
+import json
+import os
+from html import escape
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.export_reader import load_section, record_label, resolve_asset_path
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+# Section -> (page title, has detail pages)
+SITE_SECTIONS: Dict[str, Tuple[str, bool]] = {
+    "families": ("Families", True),
+    "staff": ("Staff", True),
+    "groups": ("Groups", True),
+    "pages": ("Additional Pages", True),
+    "birthdays": ("Birthdays", False),
+    "anniversaries": ("Anniversaries", False),
+}
+
+# Secondary line shown under each name in listings
+SUMMARY_FIELDS = ("members_text", "title", "description", "date")
+
+THUMBNAIL_SIZE = 160
+BUILD_STATE_FILE = ".build.json"
+
+STYLESHEET = """\
+body{font-family:system-ui,-apple-system,sans-serif;margin:0 auto;max-width:60rem;padding:1rem;color:#222}
+a{color:#0b5cab;text-decoration:none}
+nav{margin-bottom:1rem}
+ul.records{list-style:none;padding:0;margin:0}
+ul.records li{display:flex;align-items:center;gap:.75rem;padding:.5rem 0;border-bottom:1px solid #eee}
+ul.records img,ul.records .nophoto{width:64px;height:64px;object-fit:cover;border-radius:6px;background:#eee;flex:none}
+.summary{color:#666;font-size:.9rem}
+.pager{display:flex;justify-content:space-between;margin:1rem 0}
+.detail img{max-width:100%;height:auto;border-radius:8px}
+dl{display:grid;grid-template-columns:max-content 1fr;gap:.25rem 1rem}
+dt{font-weight:600}
+dd{margin:0;white-space:pre-wrap;overflow-wrap:anywhere}
+"""
+
+
+class SiteBuildError(Exception):
+    """Raised when site options are invalid"""
+    pass
+
+
+class SiteBuilder:
+    """Renders an export directory to a static site."""
+
+    def __init__(self, base_dir: str = "exports", output_dir: Optional[str] = None, page_size: int = 50):
+        """
+        Args:
+            base_dir: Export directory to read
+            output_dir: Site directory (defaults to base_dir/site)
+            page_size: Records per listing page
+
+        Raises:
+            SiteBuildError: If page_size is less than 1
+        """
+        if page_size < 1:
+            raise SiteBuildError(f"Page size must be at least 1, got {page_size}")
+        self.base_dir = base_dir
+        self.output_dir = output_dir or os.path.join(base_dir, "site")
+        self.page_size = page_size
+        self.state_path = os.path.join(self.output_dir, BUILD_STATE_FILE)
+        self.previous: Dict[str, str] = {}
+        self.current: Dict[str, str] = {}
+        self.stats = {"written": 0, "unchanged": 0, "removed": 0, "thumbnails": 0}
+
+    def build(self) -> Dict[str, int]:
+        """
+        Build or update the site.
+
+        Returns:
+            dict: Counts of pages written, unchanged and removed, and of
+            thumbnails generated
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        if os.path.exists(self.state_path):
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                self.previous = json.load(f)
+
+        self._write("style.css", STYLESHEET)
+
+        counts = []
+        for section, (title, has_details) in SITE_SECTIONS.items():
+            records = load_section(self.base_dir, section)
+            if not records:
+                continue
+            counts.append((section, title, len(records)))
+            self._build_section(section, title, records, has_details)
+
+        items = "".join(
+            f'<li><a href="{section}/index.html">{escape(title)}</a> '
+            f'<span class="summary">{count} records</span></li>'
+            for section, title, count in counts
+        )
+        self._write("index.html", self._layout("Directory", f'<h1>Directory</h1><ul class="records">{items}</ul>', ""))
+
+        # Remove pages of records that no longer exist
+        for relative_path in set(self.previous) - set(self.current):
+            path = os.path.join(self.output_dir, relative_path)
+            if os.path.exists(path):
+                os.remove(path)
+                self.stats["removed"] += 1
+
+        with open(self.state_path, 'w', encoding='utf-8') as f:
+            json.dump(self.current, f)
+
+        print(f"  Site at {self.output_dir}: {self.stats['written']} pages written, "
+              f"{self.stats['unchanged']} unchanged, {self.stats['removed']} removed, "
+              f"{self.stats['thumbnails']} thumbnails")
+        return self.stats
+
+    def _build_section(self, section: str, title: str, records: List[Dict[str, Any]], has_details: bool) -> None:
+        page_count = max(1, -(-len(records) // self.page_size))
+
+        for page_number in range(page_count):
+            chunk = records[page_number * self.page_size:(page_number + 1) * self.page_size]
+            items = []
+            for position, record in enumerate(chunk, start=page_number * self.page_size):
+                name = escape(record_label(record))
+                if has_details:
+                    name = f'<a href="{self._detail_name(record, position)}">{name}</a>'
+                summary = next((record[field] for field in SUMMARY_FIELDS if record.get(field)), "")
+                items.append(
+                    f'<li>{self._thumbnail(section, record)}<div>{name}'
+                    f'<div class="summary">{escape(str(summary))}</div></div></li>'
+                )
+
+            pager = self._pager(page_number, page_count)
+            body = (
+                f'<h1>{escape(title)}</h1>'
+                f'<p class="summary">{len(records)} records, page {page_number + 1} of {page_count}</p>'
+                f'<ul class="records">{"".join(items)}</ul>{pager}'
+            )
+            self._write(
+                f"{section}/{self._listing_name(page_number)}",
+                self._layout(title, body, "../")
+            )
+
+        if has_details:
+            for position, record in enumerate(records):
+                self._write(
+                    f"{section}/{self._detail_name(record, position)}",
+                    self._layout(record_label(record), self._detail_body(section, title, record), "../")
+                )
+
+    def _detail_body(self, section: str, title: str, record: Dict[str, Any]) -> str:
+        photo = ""
+        if record.get("photo"):
+            photo = f'<p><img src="{escape(self._asset_href(section, record["photo"]))}" alt="" decoding="async"></p>'
+
+        rows = []
+        for key, value in record.items():
+            if key == "photo" or value in ("", None, [], {}):
+                continue
+            if isinstance(value, (list, dict)):
+                value = json.dumps(value, indent=2, ensure_ascii=False)
+            rows.append(f'<dt>{escape(key.replace("_", " "))}</dt><dd>{escape(str(value))}</dd>')
+
+        return (
+            f'<p><a href="index.html">&larr; {escape(title)}</a></p>'
+            f'<div class="detail"><h1>{escape(record_label(record))}</h1>{photo}<dl>{"".join(rows)}</dl></div>'
+        )
+
+    def _thumbnail(self, section: str, record: Dict[str, Any]) -> str:
+        photo = record.get("photo", "")
+        if not photo:
+            return '<span class="nophoto"></span>'
+
+        href = self._asset_href(section, photo)
+        if Image is not None and not photo.startswith(("http://", "https://")):
+            href = self._make_thumbnail(section, photo) or href
+
+        return (
+            f'<img src="{escape(href)}" alt="" loading="lazy" decoding="async" '
+            f'width="64" height="64">'
+        )
+
+    def _make_thumbnail(self, section: str, photo: str) -> str:
+        source = resolve_asset_path(self.base_dir, photo)
+        if not os.path.exists(source):
+            return ""
+
+        name = hashlib.sha1(photo.encode('utf-8')).hexdigest()[:16] + ".jpg"
+        relative_path = f"thumbs/{name}"
+        target = os.path.join(self.output_dir, relative_path)
+        self.current[relative_path] = "thumbnail"
+
+        if not os.path.exists(target) or os.path.getmtime(target) < os.path.getmtime(source):
+            try:
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                with Image.open(source) as image:
+                    image.thumbnail((THUMBNAIL_SIZE, THUMBNAIL_SIZE))
+                    image.convert("RGB").save(target, "JPEG", quality=80, optimize=True)
+                self.stats["thumbnails"] += 1
+            except Exception as e:
+                print(f"  Warning: Could not create thumbnail for {photo}: {str(e)}")
+                self.current.pop(relative_path, None)
+                return ""
+
+        return f"../{relative_path}"
+
+    def _asset_href(self, section: str, path: str) -> str:
+        """Link to an exported asset from a page in the section directory."""
+        if path.startswith(("http://", "https://")):
+            return path
+        source = resolve_asset_path(self.base_dir, path)
+        page_dir = os.path.join(os.path.abspath(self.output_dir), section)
+        return os.path.relpath(source, page_dir).replace(os.sep, "/")
+
+    def _pager(self, page_number: int, page_count: int) -> str:
+        if page_count == 1:
+            return ""
+        previous = next_link = "<span></span>"
+        if page_number > 0:
+            previous = f'<a href="{self._listing_name(page_number - 1)}">&larr; Previous</a>'
+        if page_number < page_count - 1:
+            next_link = f'<a href="{self._listing_name(page_number + 1)}">Next &rarr;</a>'
+        return f'<div class="pager">{previous}{next_link}</div>'
+
+    @staticmethod
+    def _listing_name(page_number: int) -> str:
+        return "index.html" if page_number == 0 else f"page-{page_number + 1}.html"
+
+    @staticmethod
+    def _detail_name(record: Dict[str, Any], position: int) -> str:
+        record_id = record.get("id") or f"record_{position + 1}"
+        safe_id = "".join(ch if ch.isalnum() or ch in "-_" else "_" for ch in str(record_id))
+        return f"{safe_id}.html"
+
+    @staticmethod
+    def _layout(title: str, body: str, root: str) -> str:
+        return (
+            '<!DOCTYPE html><html lang="en"><head><meta charset="utf-8">'
+            '<meta name="viewport" content="width=device-width,initial-scale=1">'
+            f'<title>{escape(title)}</title><link rel="stylesheet" href="{root}style.css"></head>'
+            f'<body><nav><a href="{root}index.html">Directory</a></nav>{body}</body></html>'
+        )
+
+    def _write(self, relative_path: str, content: str) -> None:
+        """Write a page unless the previous build produced identical content."""
+        data = content.encode('utf-8')
+        digest = hashlib.sha1(data).hexdigest()
+        self.current[relative_path] = digest
+
+        path = os.path.join(self.output_dir, relative_path)
+        if self.previous.get(relative_path) == digest and os.path.exists(path):
+            self.stats["unchanged"] += 1
+            return
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(data)
+        self.stats["written"] += 1
+
+
+def build_site(base_dir: str = "exports", output_dir: Optional[str] = None, page_size: int = 50) -> Dict[str, int]:
+    """
+    Build or update the static browse site for an export.
+
+    Args:
+        base_dir: Export directory to read
+        output_dir: Site directory (defaults to base_dir/site)
+        page_size: Records per listing page
+
+    Returns:
+        dict: Build statistics
+    """
+    return SiteBuilder(base_dir, output_dir, page_size).build()
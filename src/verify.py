@@ -0,0 +1,179 @@
+"""
+Integrity check of an export against its manifest
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
+
+from src.export_reader import ASSET_DIRS, PHOTO_SECTIONS, load_section, resolve_asset_path
+from src.manifest import MANIFEST_FILENAME, Manifest, hash_file
+
+
+class VerifyReport:
+    """Outcome of verify_export(); paths are relative to the export directory."""
+
+    def __init__(self):
+        self.checked = 0
+        self.checked_bytes = 0
+        # Listed in the manifest or referenced by a record, not on disk
+        self.missing: List[str] = []
+        # (path, reason) whose size or hash differs from the manifest
+        self.corrupt: List[Tuple[str, str]] = []
+        # In an asset directory but neither listed nor referenced (incl. .part files)
+        self.orphaned: List[str] = []
+        # Referenced and present, but not in the manifest (older exports)
+        self.unverified: List[str] = []
+        self.manifest: Optional[Manifest] = None
+
+    @property
+    def ok(self) -> bool:
+        """True if nothing is missing or corrupt."""
+        return not self.missing and not self.corrupt
+
+    def broken(self) -> List[str]:
+        """Return the missing and corrupt paths."""
+        return self.missing + [path for path, _ in self.corrupt]
+
+
+def referenced_assets(base_dir: str) -> Set[str]:
+    """
+    Return the export-relative paths of every photo and page asset the export JSON points to.
+
+    Args:
+        base_dir: Export directory
+    """
+    stored = []
+    for section in PHOTO_SECTIONS:
+        stored.extend(record.get("photo", "") for record in load_section(base_dir, section))
+    for page in load_section(base_dir, "pages"):
+        stored.extend(asset.get("path", "") for asset in page.get("assets", []))
+
+    paths = set()
+    for path in stored:
+        if not path or path.startswith(("http://", "https://")):
+            continue
+        relative = os.path.relpath(resolve_asset_path(base_dir, path), base_dir)
+        paths.add(relative.replace(os.sep, '/'))
+    return paths
+
+
+def _check_entry(base_dir: str, path: str, entry: Dict) -> Tuple[str, str]:
+    # Returns (status, detail) for one manifest entry
+    filepath = os.path.join(base_dir, path)
+    if not os.path.exists(filepath):
+        return "missing", ""
+    size = os.path.getsize(filepath)
+    if size != entry["size"]:
+        return "corrupt", f"size {size} != {entry['size']}"
+    _, sha256 = hash_file(filepath)
+    if sha256 != entry["sha256"]:
+        return "corrupt", "sha256 mismatch"
+    return "ok", ""
+
+
+def verify_export(base_dir: str = "exports", workers: Optional[int] = None) -> VerifyReport:
+    """
+    Check an export directory against its manifest.
+
+    Args:
+        base_dir: Export directory
+        workers: Hashing threads (default: one per CPU)
+
+    Returns:
+        VerifyReport: What was found; report.manifest is None if the export has no manifest
+    """
+    report = VerifyReport()
+    manifest_path = os.path.join(base_dir, MANIFEST_FILENAME)
+    if os.path.exists(manifest_path):
+        report.manifest = Manifest.load(manifest_path, base_dir)
+    files = report.manifest.files if report.manifest else {}
+
+    paths = sorted(files)
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        results = pool.map(lambda path: _check_entry(base_dir, path, files[path]), paths)
+        for path, (status, detail) in zip(paths, results):
+            report.checked += 1
+            if status == "missing":
+                report.missing.append(path)
+            elif status == "corrupt":
+                report.corrupt.append((path, detail))
+            else:
+                report.checked_bytes += files[path]["size"]
+
+    referenced = referenced_assets(base_dir)
+    for path in sorted(referenced - set(files)):
+        if os.path.exists(os.path.join(base_dir, path)):
+            report.unverified.append(path)
+        else:
+            report.missing.append(path)
+
+    for asset_dir in ASSET_DIRS:
+        directory = os.path.join(base_dir, asset_dir)
+        if not os.path.isdir(directory):
+            continue
+        for name in sorted(os.listdir(directory)):
+            path = f"{asset_dir}/{name}"
+            if path not in files and path not in referenced:
+                report.orphaned.append(path)
+
+    return report
+
+
+async def requeue_broken(report: VerifyReport, base_dir: str = "exports", max_concurrency: int = 8) -> Dict[str, str]:
+    """
+    Download the missing and corrupt assets of a report again.
+
+    Only entries whose manifest entry records a source URL can be fetched;
+    corrupt files (and any partial download next to them) are deleted first
+    so nothing is resumed from bad data. The manifest is updated with the
+    new downloads.
+
+    Args:
+        report: Result of verify_export()
+        base_dir: Export directory
+        max_concurrency: Maximum downloads in flight
+
+    Returns:
+        dict: Export-relative path -> source URL for every broken entry that
+        could not be re-queued or failed again
+    """
+    from src.downloader import VALIDATOR_SUFFIX, download_assets_batch
+    from src.manifest import finish_manifest, record_export_file, start_manifest
+
+    files = report.manifest.files if report.manifest else {}
+    failed = {}
+    # Destination directory -> URLs
+    queued: Dict[str, List[str]] = {}
+    # URL -> export-relative path the records reference
+    targets: Dict[str, str] = {}
+
+    for path in report.broken():
+        url = files.get(path, {}).get("url", "")
+        if not url:
+            failed[path] = ""
+            continue
+        filepath = os.path.join(base_dir, path)
+        for stale in (filepath, filepath + ".part", filepath + ".part" + VALIDATOR_SUFFIX):
+            if os.path.exists(stale):
+                os.remove(stale)
+        queued.setdefault(os.path.dirname(filepath), []).append(url)
+        targets[url] = path
+        failed[path] = url
+
+    manifest = start_manifest(base_dir)
+    try:
+        for destination_dir, urls in queued.items():
+            print(f"  Re-downloading {len(urls)} assets to {destination_dir}")
+            downloaded = await download_assets_batch(urls, destination_dir, max_concurrency)
+            for url, filepath in downloaded.items():
+                target = os.path.join(base_dir, targets[url])
+                if os.path.abspath(filepath) != os.path.abspath(target):
+                    # Exports from before hashed asset names: keep the path the records use
+                    manifest.files.pop(manifest.relative(filepath), None)
+                    os.replace(filepath, target)
+                    record_export_file(target, source_url=url)
+                failed.pop(targets[url], None)
+    finally:
+        finish_manifest()
+
+    return failed
@@ -0,0 +1,196 @@
+"""
+Watch mode: cheap change detection between full exports
+"""
+import asyncio
+import hashlib
+import json
+import os
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from playwright.async_api import Page
+
+BASE_URL = 'https://members.instantchurchdirectory.com'
+LIST_SELECTOR = '.js-icd-members-family-list-item'
+
+# Section name -> list pages (path segment, item selector) that describe it
+WATCH_SECTIONS: Dict[str, List[Tuple[str, str]]] = {
+    "families": [("families", LIST_SELECTOR)],
+    "staff": [("staff", LIST_SELECTOR)],
+    "groups": [("group", LIST_SELECTOR)],
+    "events": [("birthdays", LIST_SELECTOR), ("anniversaries", LIST_SELECTOR)],
+    "pages": [("additionalpages", f'{LIST_SELECTOR}, a[href*="additionalpage"]')],
+}
+
+
+def _hash(text: str) -> str:
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()[:16]
+
+
+async def fingerprint_section(page: Page, directory_id: str, section: str) -> Dict[str, Any]:
+    """
+    Fingerprint a section from its list page(s) without scraping records.
+
+    Only the outer HTML of each list item is pulled, in a single round-trip
+    per list page, and reduced to a short hash.
+
+    Args:
+        page: Authenticated Playwright page
+        directory_id: Directory ID taken from the logged-in URL
+        section: Section name from WATCH_SECTIONS
+
+    Returns:
+        dict: Item count, per-record hashes and an overall section digest
+    """
+    records = []
+    for path, selector in WATCH_SECTIONS[section]:
+        await page.goto(f'{BASE_URL}/{path}/{directory_id}', timeout=15000)
+        await page.wait_for_load_state('networkidle', timeout=10000)
+        try:
+            await page.wait_for_selector(selector, timeout=5000)
+        except Exception:
+            # Empty sections never render an item
+            pass
+
+        items = await page.eval_on_selector_all(selector, 'els => els.map(e => e.outerHTML)')
+        records.extend(f"{path}:{_hash(html)}" for html in items)
+
+    return {
+        "count": len(records),
+        "digest": _hash("\n".join(records)),
+        "records": records,
+    }
+
+
+def diff_fingerprints(old: Optional[Dict[str, Any]], new: Dict[str, Any]) -> Dict[str, int]:
+    """
+    Compare two section fingerprints record by record.
+
+    Args:
+        old: Previous fingerprint (None if the section was never seen)
+        new: Current fingerprint
+
+    Returns:
+        dict: Counts of added and removed record fingerprints. An edited
+        record shows up as one removal plus one addition.
+    """
+    if not old:
+        return {"added": new["count"], "removed": 0}
+
+    old_records = Counter(old.get("records", []))
+    new_records = Counter(new["records"])
+    return {
+        "added": sum((new_records - old_records).values()),
+        "removed": sum((old_records - new_records).values()),
+    }
+
+
+def load_watch_state(state_path: str) -> Dict[str, Any]:
+    """Load saved fingerprints, or an empty state if none exist."""
+    if not os.path.exists(state_path):
+        return {}
+    try:
+        with open(state_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"  Warning: Ignoring unreadable watch state {state_path}: {str(e)}")
+        return {}
+
+
+def save_watch_state(state_path: str, state: Dict[str, Any]) -> None:
+    """Persist fingerprints so a restarted watcher does not re-export everything."""
+    Path(state_path).parent.mkdir(parents=True, exist_ok=True)
+    with open(state_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, ensure_ascii=False)
+
+
+async def watch(
+    page: Page,
+    export_section: Callable[[str], Awaitable[int]],
+    interval: float = 300,
+    max_interval: float = 3600,
+    backoff: float = 2.0,
+    state_path: str = "exports/watch_state.json",
+    max_polls: Optional[int] = None
+) -> None:
+    """
+    Poll list-page fingerprints and re-export only the sections that changed.
+
+    The poll interval starts at `interval`. From the second consecutive poll
+    that finds no changes it is multiplied by `backoff` after each one
+    (capped at `max_interval`), and it resets as soon as something changes.
+
+    Args:
+        page: Authenticated Playwright page
+        export_section: Callback that scrapes and exports one section by name
+            and returns the number of records it scraped
+        interval: Base poll interval in seconds
+        max_interval: Upper bound for the backed-off interval in seconds
+        backoff: Interval multiplier applied after each further unchanged poll
+        state_path: Where fingerprints are persisted between polls and runs
+        max_polls: Stop after this many polls (None to run forever)
+    """
+    match = re.search(r'/([a-f0-9-]{36})', page.url)
+    if not match:
+        print("  Warning: Could not determine directory ID")
+        return
+    directory_id = match.group(1)
+
+    state = load_watch_state(state_path)
+    delay = interval
+    polls = 0
+    unchanged_polls = 0
+
+    while max_polls is None or polls < max_polls:
+        polls += 1
+        print(f"\nPolling for changes (poll {polls})...")
+
+        changed = []
+        for section in WATCH_SECTIONS:
+            try:
+                fingerprint = await fingerprint_section(page, directory_id, section)
+            except Exception as e:
+                print(f"  Warning: Could not fingerprint {section}: {str(e)}")
+                continue
+
+            previous = state.get(section)
+            if previous and previous.get("digest") == fingerprint["digest"]:
+                continue
+
+            diff = diff_fingerprints(previous, fingerprint)
+            print(f"  {section}: {fingerprint['count']} records "
+                  f"(+{diff['added']} / -{diff['removed']} changed fingerprints)")
+            changed.append((section, fingerprint))
+
+        for section, fingerprint in changed:
+            # On failure the old fingerprint is kept so the section is retried next poll
+            try:
+                count = await export_section(section)
+            except Exception as e:
+                print(f"  Error re-exporting {section}: {str(e)}")
+                continue
+            if not count and fingerprint["count"]:
+                # Scrapers report errors and return no records rather than raising
+                print(f"  Error re-exporting {section}: no records scraped, "
+                      f"{fingerprint['count']} listed")
+                continue
+            state[section] = fingerprint
+
+        if changed:
+            save_watch_state(state_path, state)
+            delay = interval
+            unchanged_polls = 0
+        else:
+            print("  No changes detected")
+            unchanged_polls += 1
+            # A single quiet poll keeps the base interval
+            if unchanged_polls > 1:
+                delay = min(delay * backoff, max_interval)
+
+        if max_polls is not None and polls >= max_polls:
+            break
+
+        print(f"  Next poll in {delay:.0f} seconds")
+        await asyncio.sleep(delay)
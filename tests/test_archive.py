@@ -0,0 +1,42 @@
+import json
+import os
+import zipfile
+
+import pytest
+
+from src.archive import ArchiveError, ExportArchive
+
+
+def test_entries_are_named_relative_to_the_export_directory(tmp_path):
+    path = str(tmp_path / "export.zip")
+    archive = ExportArchive(path)
+    archive.add_bytes(os.path.join("exports", "families.json"), b'{"families": []}')
+    archive.add_bytes(os.path.join("exports", "families", "photos", "a.jpg"), b"jpeg", "https://example.org/a.jpg")
+    archive.close()
+
+    with zipfile.ZipFile(path) as f:
+        assert sorted(f.namelist()) == ["families.json", "families/photos/a.jpg", "manifest.json"]
+        manifest = json.loads(f.read("manifest.json"))
+    assert manifest["files"]["families/photos/a.jpg"]["url"] == "https://example.org/a.jpg"
+
+
+def test_rewriting_an_entry_raises(tmp_path):
+    archive = ExportArchive(str(tmp_path / "export.tar.gz"))
+    filepath = os.path.join("exports", "staff.json")
+    archive.add_bytes(filepath, b'{"staff": []}')
+
+    with pytest.raises(ArchiveError):
+        archive.add_bytes(filepath, b'{"staff": [{}]}')
+    archive.close()
+
+
+def test_has_checks_the_source_url(tmp_path):
+    archive = ExportArchive(str(tmp_path / "export.zip"))
+    filepath = os.path.join("exports", "groups", "photos", "g.jpg")
+    assert not archive.has(filepath)
+
+    archive.add_bytes(filepath, b"jpeg", "https://example.org/g.jpg")
+    assert archive.has(filepath)
+    assert archive.has(filepath, "https://example.org/g.jpg")
+    assert not archive.has(filepath, "https://example.org/other.jpg")
+    archive.close()
@@ -0,0 +1,21 @@
+from src.calendar_index import parse_month_day
+
+
+def test_common_date_forms():
+    assert parse_month_day("January 5") == "01-05"
+    assert parse_month_day("Jan 5, 1980") == "01-05"
+    assert parse_month_day("5 January") == "01-05"
+    assert parse_month_day("1/5/1980") == "01-05"
+    assert parse_month_day("1980-01-05") == "01-05"
+    assert parse_month_day("February 29") == "02-29"
+
+
+def test_later_candidates_are_tried():
+    assert parse_month_day("Married 25 years on June 3") == "06-03"
+    assert parse_month_day("Since 12 years, March 14th") == "03-14"
+
+
+def test_unrecognized():
+    assert parse_month_day("") == ""
+    assert parse_month_day("Married 25 years") == ""
+    assert parse_month_day("February 30") == ""
@@ -0,0 +1,80 @@
+import pytest
+
+pytest.importorskip("pyarrow")
+
+import pyarrow  # noqa: E402
+import pyarrow.ipc  # noqa: E402
+import pyarrow.parquet  # noqa: E402
+
+from src.columnar import read_columnar, write_columnar  # noqa: E402
+
+BATCH_SIZE = 4
+
+
+def staff_records(count):
+    titles = ["Pastor", "Deacon", None, "Elder"]
+    return [
+        {"id": f"staff_{i}", "name": f"Staff {i}", "title": titles[i % len(titles)],
+         "email": f"staff{i}@church.org" if i % 3 else None, "phone": "", "photo": None}
+        for i in range(count)
+    ]
+
+
+def group_records(count):
+    leaders = [["Ann", "Bob"], [], None, ["Carl"]]
+    return [
+        {"id": f"group_{i}", "name": f"Group {i}", "description": "", "leaders": leaders[i % len(leaders)],
+         "photo": f"exports/groups/photos/g{i}.jpg"}
+        for i in range(count)
+    ]
+
+
+def family_records(count):
+    return [
+        {"id": f"family_{i}", "name": f"Family {i}", "members_text": "John & Mary",
+         "members": [{"name": "John", "email": "", "phone": ""}] if i % 2 else [],
+         "photo": None, "detail_url": "", "contact": {"emails": [f"f{i}@example.org"]} if i % 2 else {}}
+        for i in range(count)
+    ]
+
+
+def birthday_records(count):
+    # Later batches add new dates, so dictionaries grow between batches
+    return [{"name": f"Person {i}", "date": f"June {i // 3 + 1}", "month_day": f"06-{i // 3 + 1:02d}"}
+            for i in range(count)]
+
+
+SECTIONS = {
+    "staff": staff_records,
+    "groups": group_records,
+    "families": family_records,
+    "birthdays": birthday_records,
+}
+
+
+@pytest.mark.parametrize("fmt,extension", [("parquet", ".parquet"), ("arrow", ".arrow")])
+@pytest.mark.parametrize("section", sorted(SECTIONS))
+def test_round_trip(tmp_path, section, fmt, extension):
+    records = SECTIONS[section](11)
+    path = str(tmp_path / (section + extension))
+
+    assert write_columnar(section, records, path, fmt, batch_size=BATCH_SIZE) == len(records)
+    assert read_columnar(section, path) == records
+
+
+@pytest.mark.parametrize("fmt,extension", [("parquet", ".parquet"), ("arrow", ".arrow")])
+def test_batches_and_dictionary_columns(tmp_path, fmt, extension):
+    path = str(tmp_path / ("birthdays" + extension))
+    write_columnar("birthdays", birthday_records(11), path, fmt, batch_size=BATCH_SIZE)
+
+    if fmt == "parquet":
+        metadata = pyarrow.parquet.ParquetFile(path).metadata
+        assert metadata.num_row_groups == 3
+        table = pyarrow.parquet.read_table(path, read_dictionary=["date"])
+    else:
+        with pyarrow.memory_map(path) as source:
+            reader = pyarrow.ipc.open_file(source)
+            assert reader.num_record_batches == 3
+            table = reader.read_all()
+
+    assert pyarrow.types.is_dictionary(table.schema.field("date").type)
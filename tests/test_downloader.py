@@ -0,0 +1,85 @@
+import pytest
+
+pytest.importorskip("aiohttp")
+pytest.importorskip("aiofiles")
+
+from src.downloader import asset_filename  # noqa: E402
+
+
+def test_same_basename_gets_distinct_files():
+    first = asset_filename("https://example.org/a/bulletin.pdf")
+    second = asset_filename("https://example.org/b/bulletin.pdf")
+    assert first != second
+    assert first.startswith("bulletin_") and first.endswith(".pdf")
+
+
+def test_url_without_filename():
+    assert asset_filename("https://example.org/photo?id=1").startswith("asset_")
+
+
+BODY = bytes(range(256)) * 400
+ETAG = '"v1"'
+
+
+async def serve_body(request):
+    from aiohttp import web
+
+    range_header = request.headers.get("Range", "")
+    if not range_header or request.headers.get("If-Range") != ETAG:
+        return web.Response(body=BODY, headers={"ETag": ETAG})
+    start = int(range_header[len("bytes="):].rstrip("-"))
+    if start >= len(BODY):
+        return web.Response(status=416, headers={"Content-Range": f"bytes */{len(BODY)}"})
+    return web.Response(status=206, body=BODY[start:], headers={
+        "ETag": ETAG, "Content-Range": f"bytes {start}-{len(BODY) - 1}/{len(BODY)}"
+    })
+
+
+def download_with_partial(tmp_path, partial, validator):
+    """Download from a local server with a .part file (and validator) left in place."""
+    import asyncio
+
+    from aiohttp import web
+
+    from src.downloader import VALIDATOR_SUFFIX, download_asset
+
+    async def run():
+        app = web.Application()
+        app.router.add_get("/bulletin.pdf", serve_body)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        url = f"http://127.0.0.1:{port}/bulletin.pdf"
+
+        part_path = str(tmp_path / asset_filename(url)) + ".part"
+        with open(part_path, "wb") as f:
+            f.write(partial)
+        if validator:
+            with open(part_path + VALIDATOR_SUFFIX, "w") as f:
+                f.write(validator)
+        try:
+            return await download_asset(url, str(tmp_path))
+        finally:
+            await runner.cleanup()
+
+    path = asyncio.run(run())
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def test_resume_appends_to_matching_partial(tmp_path):
+    assert download_with_partial(tmp_path, BODY[:1000], ETAG) == BODY
+
+
+def test_partial_longer_than_remote_is_restarted(tmp_path):
+    assert download_with_partial(tmp_path, BODY + b"stale", ETAG) == BODY
+
+
+def test_changed_file_is_not_spliced(tmp_path):
+    assert download_with_partial(tmp_path, b"x" * 1000, '"v0"') == BODY
+
+
+def test_partial_without_validator_is_restarted(tmp_path):
+    assert download_with_partial(tmp_path, b"x" * 1000, "") == BODY
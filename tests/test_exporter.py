@@ -0,0 +1,43 @@
+import asyncio
+import json
+
+from src import exporter
+from src.exporter import export_json_chunks, export_to_json
+from src.models import Event, Family, Member
+
+
+def test_export_to_json_writes_records_one_per_line(tmp_path, monkeypatch):
+    # Several chunks, the last one partial
+    monkeypatch.setattr(exporter, "RECORD_BATCH_SIZE", 2)
+    families = [Family(id=f"family_{i}", name=f"Family {i}", members=[Member(name="Zoë")]) for i in range(5)]
+
+    path = asyncio.run(export_to_json("families", families, base_dir=str(tmp_path)))
+
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    document = json.loads(text)
+    assert document["metadata"]["total_records"] == 5
+    assert document["families"][4] == {
+        "id": "family_4", "name": "Family 4", "members_text": "",
+        "members": [{"name": "Zoë", "email": "", "phone": ""}],
+        "photo": "", "detail_url": "", "contact": {},
+    }
+    assert [family["id"] for family in document["families"]] == [family.id for family in families]
+    assert "Zoë" in text
+    assert len(text.splitlines()) == 2 + 1 + 5 + 2
+
+
+def test_export_json_chunks_matches_json_dumps():
+    export_data = {
+        "metadata": {"total_records": 1},
+        "birthdays": [Event(name="Ann", date="June 1", month_day="06-01")],
+        "anniversaries": [],
+    }
+
+    document = json.loads("".join(export_json_chunks(export_data)))
+
+    assert document == {
+        "metadata": {"total_records": 1},
+        "birthdays": [{"name": "Ann", "date": "June 1", "month_day": "06-01"}],
+        "anniversaries": [],
+    }
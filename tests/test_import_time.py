@@ -0,0 +1,46 @@
+"""
+Import-time budget of the entry points (see benchmarks/import_time.py for wall-clock timings)
+"""
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Cumulative import time allowed, from `python -X importtime`
+BUDGET_MS = 150
+
+# Modules that must not be loaded just by starting an entry point
+HEAVY_MODULES = ("playwright", "aiohttp", "aiofiles", "dotenv", "pyarrow")
+
+
+def import_times(*args):
+    """Return {module: cumulative microseconds} for every module loaded by `python -X importtime *args`."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = (int(cumulative), not name[1:].startswith(" "))
+    return modules
+
+
+@pytest.mark.parametrize("command", [
+    ("offline.py", "--help"),
+    ("-c", "import scraper"),
+], ids=["offline", "scraper"])
+def test_entry_point_imports_within_budget(command):
+    modules = import_times(*command)
+
+    heavy = sorted(name for name in modules if name.split(".")[0] in HEAVY_MODULES)
+    assert not heavy, f"imported at startup: {', '.join(heavy)}"
+
+    # Top-level entries' cumulative times add up to the whole import time
+    total_ms = sum(cumulative for cumulative, top_level in modules.values() if top_level) / 1000
+    assert total_ms <= BUDGET_MS, f"imports took {total_ms:.0f} ms (budget {BUDGET_MS} ms)"
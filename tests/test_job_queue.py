@@ -0,0 +1,87 @@
+import time
+
+import pytest
+
+from src.job_queue import DONE, FAILED, PENDING, JobQueue
+
+
+@pytest.fixture
+def queue_path(tmp_path):
+    return str(tmp_path / "queue.sqlite")
+
+
+def test_enqueue_is_idempotent(queue_path):
+    with JobQueue(queue_path) as queue:
+        assert queue.enqueue_many("page", [("a", {}), ("b", {})]) == 2
+        assert queue.enqueue_many("page", [("a", {}), ("c", {})]) == 1
+        assert queue.remaining() == 3
+
+
+def test_two_workers_never_claim_the_same_job(queue_path):
+    with JobQueue(queue_path) as first, JobQueue(queue_path) as second:
+        first.enqueue_many("page", [(str(i), {"i": i}) for i in range(5)])
+
+        claimed_by_first = first.claim("w1", ["page"], limit=3)
+        claimed_by_second = second.claim("w2", ["page"], limit=3)
+
+        assert len(claimed_by_first) == 3
+        assert len(claimed_by_second) == 2
+        assert not {job.key for job in claimed_by_first} & {job.key for job in claimed_by_second}
+        assert second.claim("w2", ["page"]) == []
+
+
+def test_claim_only_returns_requested_kinds(queue_path):
+    with JobQueue(queue_path) as queue:
+        queue.enqueue("page", "a", {})
+        queue.enqueue("asset", "b", {})
+        assert [job.key for job in queue.claim("w1", ["asset"], limit=5)] == ["b"]
+
+
+def test_expired_lease_is_reclaimed(queue_path):
+    with JobQueue(queue_path, lease_seconds=0.05) as queue:
+        queue.enqueue("page", "a", {})
+        assert queue.claim("w1", ["page"])
+        # Still leased: nothing to claim
+        assert queue.claim("w2", ["page"]) == []
+
+        time.sleep(0.1)
+        jobs = queue.claim("w2", ["page"])
+        assert [job.key for job in jobs] == ["a"]
+
+
+def test_complete_after_stolen_lease_returns_false(queue_path):
+    with JobQueue(queue_path, lease_seconds=0.05) as queue:
+        queue.enqueue("page", "a", {})
+        stale = queue.claim("w1", ["page"])[0]
+        time.sleep(0.1)
+        current = queue.claim("w2", ["page"])[0]
+
+        assert queue.complete(stale, "w1", {"by": "w1"}) is False
+        assert queue.complete(current, "w2", {"by": "w2"}) is True
+        assert queue.results("page") == {"a": {"by": "w2"}}
+        assert queue.counts() == {DONE: 1}
+
+
+def test_failed_jobs_retry_until_max_attempts(queue_path):
+    with JobQueue(queue_path, max_attempts=2) as queue:
+        queue.enqueue("page", "a", {})
+
+        queue.fail(queue.claim("w1", ["page"])[0], "w1", "timeout")
+        assert queue.counts() == {PENDING: 1}
+
+        queue.fail(queue.claim("w1", ["page"])[0], "w1", "timeout again")
+        assert queue.counts() == {FAILED: 1}
+        assert queue.errors("page") == {"a": "timeout again"}
+        assert queue.remaining() == 0
+
+
+def test_expired_lease_out_of_attempts_is_marked_failed(queue_path):
+    with JobQueue(queue_path, lease_seconds=0.05, max_attempts=1) as queue:
+        queue.enqueue("page", "a", {})
+        assert queue.claim("w1", ["page"])
+        time.sleep(0.1)
+
+        # The worker died; the job is not handed out again
+        assert queue.claim("w2", ["page"]) == []
+        assert queue.errors() == {"a": "lease expired"}
+        assert queue.remaining() == 0
@@ -0,0 +1,49 @@
+from src.models import Group
+from src.normalize import normalize_groups, parse_leaders, split_names
+
+
+def test_leaders_need_a_separator_after_leader():
+    assert parse_leaders("Leader training for adults") == []
+    assert parse_leaders("Leadership retreat\nMeets monthly") == []
+
+
+def test_leaders_with_colon():
+    assert parse_leaders("Youth Group\nLeaders: Ann, Bob & Carl") == ["Ann", "Bob", "Carl"]
+    assert parse_leaders("Choir\nleader: Sue") == ["Sue"]
+
+
+def test_led_by_with_or_without_colon():
+    assert parse_leaders("Bible Study\nLed by Dana and Eve") == ["Dana", "Eve"]
+    assert parse_leaders("Bible Study\nLed by: Frank") == ["Frank"]
+
+
+def test_split_names():
+    assert split_names(" John, Mary & Tim ") == ["John", "Mary", "Tim"]
+    assert split_names("Alexander Sandy") == ["Alexander Sandy"]
+
+
+def test_normalize_groups_keeps_existing_leaders():
+    groups = [Group(id="g1", name="A", leaders=["Zed"]), Group(id="g2", name="B")]
+    normalize_groups(groups, ["Leaders: Ann", "Leader training for adults"])
+    assert groups[0].leaders == ["Zed"]
+    assert groups[1].leaders == []
+
+
+def test_normalize_families_members_and_contacts():
+    from src.models import Family
+    from src.normalize import normalize_families
+
+    phones = ["(555) 123-4567", "555.123.4567"]
+    families = [
+        Family(id="f1", members_text="John & Mary", contact={"phones": phones, "emails": [" A@X.org", "a@x.org"]}),
+        Family(id="f2", members_text="John & Mary"),
+    ]
+    normalize_families(families)
+
+    assert [member.name for member in families[0].members] == ["John", "Mary"]
+    assert families[0].members == families[1].members
+    assert families[0].members is not families[1].members
+    # Contact lists are normalized in place
+    assert families[0].contact["phones"] is phones
+    assert phones == ["+15551234567"]
+    assert families[0].contact["emails"] == ["a@x.org"]
@@ -0,0 +1,107 @@
+import asyncio
+import json
+
+import pytest
+
+from src.scheduler import (
+    DEFAULT_PRIORITY,
+    RunScheduler,
+    SchedulerError,
+    load_deferred_urls,
+)
+
+
+def test_priority_reorders_sections_and_keeps_downloads_last():
+    scheduler = RunScheduler(60, priority=["photos", "pages", "staff"])
+    assert scheduler.stages == [
+        "pages", "staff", "families", "events", "groups", "photos", "page_assets"
+    ]
+    assert scheduler.section_order(["families", "staff", "groups", "events", "pages"]) == [
+        "pages", "staff", "families", "events", "groups"
+    ]
+
+
+def test_default_priority():
+    assert RunScheduler(60).stages == list(DEFAULT_PRIORITY)
+
+
+def test_invalid_deadline_and_stage():
+    with pytest.raises(SchedulerError):
+        RunScheduler(0)
+    with pytest.raises(SchedulerError):
+        RunScheduler(60, priority=["familes"])
+
+
+def test_budget_is_weighted_share_of_time_left():
+    scheduler = RunScheduler(100, reserve=0)
+    # families weighs 3 of the 14 total
+    assert scheduler.budget("families") == pytest.approx(100 * 3 / 14, rel=0.01)
+    # The last stage gets everything left
+    assert scheduler.budget("page_assets") == pytest.approx(100, rel=0.01)
+
+
+def test_run_section_is_cut_off_at_the_deadline():
+    scheduler = RunScheduler(0.2, reserve=0)
+
+    async def slow():
+        await asyncio.sleep(5)
+
+    assert asyncio.run(scheduler.run_section("families", slow)) is False
+    assert scheduler.deferred["sections"] == [{"section": "families", "reason": "deadline"}]
+    assert scheduler.usage["families"]["used"] < 1
+
+
+def test_run_section_skipped_when_out_of_time():
+    scheduler = RunScheduler(0.01, reserve=0)
+
+    async def run():
+        await asyncio.sleep(0.05)
+        return await scheduler.run_section("staff", asyncio.sleep)
+
+    assert asyncio.run(run()) is False
+    assert scheduler.deferred["sections"] == [{"section": "staff", "reason": "not started"}]
+
+
+def test_run_downloads_defers_jobs_past_the_budget():
+    # photos gets 4/6 of the time left, the rest is page_assets'
+    scheduler = RunScheduler(0.3, reserve=0)
+
+    def job(seconds, result):
+        async def run():
+            await asyncio.sleep(seconds)
+            return result
+        return run
+
+    jobs = [job(0, "a"), job(5, "b"), job(0, "c"), job(5, "d")]
+    results, deferred = asyncio.run(scheduler.run_downloads("photos", jobs, max_concurrency=4))
+
+    assert results == ["a", None, "c", None]
+    assert deferred == [1, 3]
+
+
+def test_failed_download_is_not_deferred():
+    scheduler = RunScheduler(5, reserve=0)
+
+    async def fails():
+        raise OSError("connection reset")
+
+    async def works():
+        return "path"
+
+    results, deferred = asyncio.run(scheduler.run_downloads("photos", [fails, works]))
+    assert results == [None, "path"]
+    assert deferred == []
+
+
+def test_deferred_urls_round_trip_and_come_first(tmp_path):
+    scheduler = RunScheduler(60)
+    scheduler.defer("photos", {"section": "staff", "id": "s1", "url": "https://x/b.jpg"})
+    scheduler.defer("page_assets", {"url": "https://x/c.pdf"})
+    (tmp_path / "deferred.json").write_bytes(scheduler.to_json())
+
+    previous = load_deferred_urls(str(tmp_path))
+    assert previous == {"https://x/b.jpg", "https://x/c.pdf"}
+
+    next_run = RunScheduler(60, previously_deferred=previous)
+    assert next_run.urgent_first(["https://x/a.jpg", "https://x/b.jpg"]) == ["https://x/b.jpg", "https://x/a.jpg"]
+    assert json.loads(scheduler.to_json())["deferred"]["sections"] == []
@@ -0,0 +1,9 @@
+import pytest
+
+from src.static_site import SiteBuildError, SiteBuilder
+
+
+@pytest.mark.parametrize("page_size", [0, -1])
+def test_page_size_must_be_positive(tmp_path, page_size):
+    with pytest.raises(SiteBuildError):
+        SiteBuilder(str(tmp_path), page_size=page_size)
@@ -0,0 +1,60 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("playwright")
+
+from src import watcher  # noqa: E402
+
+
+class FakePage:
+    url = "https://members.instantchurchdirectory.com/families/01234567-89ab-cdef-0123-456789abcdef"
+
+
+def test_backoff_starts_after_second_unchanged_poll(tmp_path, monkeypatch):
+    delays = []
+
+    async def fingerprint_section(page, directory_id, section):
+        return {"digest": "same", "count": 1, "records": []}
+
+    async def sleep(delay):
+        delays.append(delay)
+
+    async def export_section(section):
+        return 1
+
+    monkeypatch.setattr(watcher, "fingerprint_section", fingerprint_section)
+    monkeypatch.setattr(watcher.asyncio, "sleep", sleep)
+
+    asyncio.run(watcher.watch(
+        FakePage(), export_section, interval=10, max_interval=35, backoff=2.0,
+        state_path=str(tmp_path / "watch_state.json"), max_polls=6
+    ))
+
+    # The first poll exports everything, then the same fingerprints keep coming back
+    assert delays == [10, 10, 20, 35, 35]
+
+
+def test_section_is_retried_when_export_scrapes_nothing(tmp_path, monkeypatch):
+    exported = []
+
+    async def fingerprint_section(page, directory_id, section):
+        return {"digest": "same", "count": 3, "records": []}
+
+    async def sleep(delay):
+        pass
+
+    async def export_section(section):
+        # Scrapers catch their errors and return no records
+        exported.append(section)
+        return 0
+
+    monkeypatch.setattr(watcher, "fingerprint_section", fingerprint_section)
+    monkeypatch.setattr(watcher.asyncio, "sleep", sleep)
+
+    state_path = tmp_path / "watch_state.json"
+    asyncio.run(watcher.watch(FakePage(), export_section, state_path=str(state_path), max_polls=2))
+
+    # Nothing was stored, so every section is exported again on the second poll
+    assert exported == list(watcher.WATCH_SECTIONS) * 2
+    assert watcher.load_watch_state(str(state_path)) == {}